@@ -0,0 +1,26 @@
+"""
+Custom response classes for API routes
+"""
+
+from typing import Any
+from fastapi.responses import Response
+from pydantic import BaseModel
+import msgspec
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode objects msgspec does not support natively"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook, decimal_format="number")
+
+
+class MsgspecResponse(Response):
+    """JSON response encoded with msgspec"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
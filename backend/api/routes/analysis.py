@@ -16,7 +16,7 @@ from services.analyzer import TechnicalAnalyzer, PerformanceAnalyzer
 from core.config import get_settings
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(tags=["analysis"])
 
 
 class AnalysisRequest(BaseModel):
@@ -82,6 +82,7 @@ async def analyze_performance(request: AnalysisRequest):
                 
                 # Calculate returns
                 returns = analyzer.calculate_returns(prices)
+                risk_metrics = analyzer.analyze(returns, prices)
                 
                 # Performance metrics
                 metrics = {
@@ -89,10 +90,10 @@ async def analyze_performance(request: AnalysisRequest):
                     "timeframe": request.timeframe.value,
                     "total_return": analyzer.calculate_total_return(prices),
                     "annualized_return": analyzer.calculate_annualized_return(returns, len(prices)),
-                    "volatility": analyzer.calculate_volatility(returns),
-                    "sharpe_ratio": analyzer.calculate_sharpe_ratio(returns),
-                    "max_drawdown": analyzer.calculate_max_drawdown(prices),
-                    "calmar_ratio": analyzer.calculate_calmar_ratio(returns, prices),
+                    "volatility": risk_metrics["volatility"],
+                    "sharpe_ratio": risk_metrics["sharpe_ratio"],
+                    "max_drawdown": risk_metrics["max_drawdown"],
+                    "calmar_ratio": risk_metrics["calmar_ratio"],
                     "avg_volume": np.mean(volumes) if volumes else 0,
                     "price_range": {
                         "min": min(prices),
@@ -171,19 +172,24 @@ async def analyze_volatility(request: VolatilityAnalysisRequest):
             analyzer = PerformanceAnalyzer()
             volatility_results = {}
             
-            for symbol, hist_data in historical_data.items():
-                prices = [float(point.close) for point in hist_data.data]
-                returns = analyzer.calculate_returns(prices)
+            returns_by_symbol = {
+                symbol: analyzer.calculate_returns([float(point.close) for point in hist_data.data])
+                for symbol, hist_data in historical_data.items()
+            }
+            bulk_metrics = analyzer.bulk_analyze(returns_by_symbol)
+            
+            for symbol, returns in returns_by_symbol.items():
+                risk_metrics = bulk_metrics[symbol]
                 
                 # Calculate different volatility measures
                 volatility_metrics = {
                     "symbol": symbol,
-                    "historical_volatility": analyzer.calculate_volatility(returns),
-                    "rolling_volatility": analyzer.calculate_rolling_volatility(returns, request.window),
+                    "historical_volatility": risk_metrics["volatility"],
+                    "rolling_volatility": analyzer.calculate_rolling_volatility(returns, request.window).tolist(),
                     "garch_volatility": analyzer.calculate_garch_volatility(returns),
-                    "var_95": analyzer.calculate_var(returns, confidence_level=0.95),
-                    "var_99": analyzer.calculate_var(returns, confidence_level=0.99),
-                    "conditional_var": analyzer.calculate_cvar(returns),
+                    "var_95": risk_metrics["var_95"],
+                    "var_99": risk_metrics["var_99"],
+                    "conditional_var": risk_metrics["conditional_var"],
                     "volatility_clustering": analyzer.detect_volatility_clustering(returns),
                     "volatility_regime": analyzer.identify_volatility_regime(returns)
                 }
@@ -6,6 +6,7 @@ from typing import List, Optional, Dict, Any
 from fastapi import APIRouter, HTTPException, Query, Path, Depends
 from fastapi.responses import JSONResponse
 import structlog
+import msgspec
 
 from models.asset import (
     AssetInfo, PriceData, HistoricalData, MarketSummary, AssetListItem,
@@ -15,9 +16,10 @@ from models.asset import (
 from services.data_collector import DataCollector, get_asset_type_from_symbol
 from core.config import get_settings, ASSET_MAPPINGS
 from api.deps import get_current_user_optional
+from api.responses import MsgspecResponse
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(tags=["assets"])
 
 
 @router.get(
@@ -39,20 +41,20 @@ async def list_assets(
         
         # Add cryptocurrencies
         for symbol, coin_id in ASSET_MAPPINGS["cryptocurrencies"].items():
-            all_assets.append(AssetListItem(
-                symbol=symbol,
-                name=coin_id.replace("-", " ").title(),
-                asset_type=AssetType.CRYPTOCURRENCY
-            ))
+            all_assets.append(msgspec.convert({
+                "symbol": symbol,
+                "name": coin_id.replace("-", " ").title(),
+                "asset_type": AssetType.CRYPTOCURRENCY
+            }, AssetListItem))
         
         # Add traditional assets
         for symbol, ticker in ASSET_MAPPINGS["traditional"].items():
-            asset_type = AssetType.INDEX if ticker.startswith("^") else AssetType.ETF
-            all_assets.append(AssetListItem(
-                symbol=symbol,
-                name=symbol,  # Could be enhanced with real names
-                asset_type=asset_type
-            ))
+            item_type = AssetType.INDEX if ticker.startswith("^") else AssetType.ETF
+            all_assets.append(msgspec.convert({
+                "symbol": symbol,
+                "name": symbol,  # Could be enhanced with real names
+                "asset_type": item_type
+            }, AssetListItem))
         
         # Apply filters
         filtered_assets = all_assets
@@ -75,7 +77,7 @@ async def list_assets(
         
         total_pages = (total + per_page - 1) // per_page
         
-        return PaginatedAssetResponse(
+        return MsgspecResponse(PaginatedAssetResponse(
             data=paginated_assets,
             total=total,
             page=page,
@@ -83,7 +85,7 @@ async def list_assets(
             total_pages=total_pages,
             has_next=page < total_pages,
             has_prev=page > 1
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Error listing assets: {str(e)}")
@@ -152,10 +154,10 @@ async def get_asset_historical(
                     detail=f"Historical data not found for asset: {symbol}"
                 )
             
-            return AssetResponse(
+            return MsgspecResponse(AssetResponse(
                 data=historical_data,
                 message=f"Historical data for {symbol} ({timeframe.value})"
-            )
+            ))
             
     except HTTPException:
         raise
@@ -361,34 +363,34 @@ async def search_assets(
             name = coin_id.replace("-", " ").title()
             if (query_lower in symbol.lower() or query_lower in name.lower()):
                 if not asset_type or asset_type == AssetType.CRYPTOCURRENCY:
-                    all_assets.append(AssetListItem(
-                        symbol=symbol,
-                        name=name,
-                        asset_type=AssetType.CRYPTOCURRENCY
-                    ))
+                    all_assets.append(msgspec.convert({
+                        "symbol": symbol,
+                        "name": name,
+                        "asset_type": AssetType.CRYPTOCURRENCY
+                    }, AssetListItem))
         
         # Search in traditional assets
         for symbol, ticker in ASSET_MAPPINGS["traditional"].items():
             if query_lower in symbol.lower():
                 asset_type_detected = AssetType.INDEX if ticker.startswith("^") else AssetType.ETF
                 if not asset_type or asset_type == asset_type_detected:
-                    all_assets.append(AssetListItem(
-                        symbol=symbol,
-                        name=symbol,
-                        asset_type=asset_type_detected
-                    ))
+                    all_assets.append(msgspec.convert({
+                        "symbol": symbol,
+                        "name": symbol,
+                        "asset_type": asset_type_detected
+                    }, AssetListItem))
         
         # Limit results
         results = all_assets[:limit]
         
-        return AssetResponse(
+        return MsgspecResponse(AssetResponse(
             data={
                 "query": query,
                 "results": results,
                 "total_found": len(results)
             },
             message=f"Found {len(results)} assets matching '{query}'"
-        )
+        ))
         
     except Exception as e:
         logger.error(f"Error searching assets: {str(e)}")
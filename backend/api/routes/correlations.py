@@ -14,7 +14,7 @@ from services.analyzer import CorrelationAnalyzer
 from core.config import get_settings
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(tags=["correlations"])
 
 
 class CorrelationRequest(BaseModel):
@@ -16,7 +16,7 @@ from services.analyzer import PerformanceAnalyzer, RiskAnalyzer
 from core.config import get_settings
 
 logger = structlog.get_logger()
-router = APIRouter()
+router = APIRouter(tags=["portfolio"])
 
 
 class PortfolioPosition(BaseModel):
@@ -53,7 +53,7 @@ class OptimizationRequest(BaseModel):
     symbols: List[str] = Field(..., min_items=2, max_items=20, description="Assets to include")
     total_value: Decimal = Field(..., gt=0, description="Total portfolio value")
     risk_tolerance: str = Field(default="moderate", description="Risk tolerance: conservative, moderate, aggressive")
-    timeframe: TimeframeEnum = Field(default=TimefraneEnum.ONE_YEAR, description="Optimization timeframe")
+    timeframe: TimeframeEnum = Field(default=TimeframeEnum.ONE_YEAR, description="Optimization timeframe")
 
 
 class RebalancingRequest(BaseModel):
@@ -412,7 +412,7 @@ def calculate_portfolio_metrics(
         benchmark_prices = [float(point.close) for point in benchmark_data.data]
         benchmark_returns = PerformanceAnalyzer().calculate_returns(benchmark_prices)
         
-        if portfolio_returns and benchmark_returns:
+        if portfolio_returns and len(benchmark_returns) > 0:
             portfolio_ret = PerformanceAnalyzer().calculate_returns(portfolio_returns)
             
             # Calculate beta and alpha
@@ -5,7 +5,6 @@ Application configuration using Pydantic Settings
 from typing import List, Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings
-from functools import lru_cache
 import os
 
 
@@ -35,6 +34,7 @@ class Settings(BaseSettings):
     # Cache settings
     redis_url: str = Field(default="redis://localhost:6379/0", env="REDIS_URL")
     cache_ttl: int = Field(default=300, env="CACHE_TTL")  # 5 minutes
+    historical_cache_dir: str = Field(default=".cache/historical", env="HISTORICAL_CACHE_DIR")
     
     # Database settings (for future use)
     database_url: str = Field(
@@ -49,6 +49,7 @@ class Settings(BaseSettings):
     # Data source settings
     default_vs_currency: str = Field(default="usd", env="DEFAULT_VS_CURRENCY")
     max_historical_days: int = Field(default=365, env="MAX_HISTORICAL_DAYS")
+    http2_enabled: bool = Field(default=False, env="HTTP2_ENABLED")  # opt in to httpx for http2 sources
     
     # Analysis settings
     correlation_window: int = Field(default=30, env="CORRELATION_WINDOW")  # days
@@ -83,15 +84,19 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
     
     class Config:
-        env_file = ".env"
+        # Only read .env in development; production gets its env from the orchestrator
+        env_file = ".env" if os.environ.get("ENVIRONMENT", "development").lower() == "development" else None
         env_file_encoding = "utf-8"
         case_sensitive = False
 
 
-@lru_cache()
+# Settings are immutable after boot, so build them once at import time
+SETTINGS: Settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance"""
-    return Settings()
+    """Get the application settings instance"""
+    return SETTINGS
 
 
 # Asset mappings for different data sources
@@ -128,6 +133,9 @@ ASSET_MAPPINGS = {
 DATA_SOURCES = {
     "coingecko": {
         "base_url": "https://api.coingecko.com/api/v3",
+        "rate_limit": 30,  # requests per minute (public API)
+        "max_concurrency": 5,
+        "http2": True,  # multiplexed over one httpx connection when HTTP2_ENABLED is set
         "endpoints": {
             "price": "/simple/price",
             "historical": "/coins/{id}/history",
@@ -7,12 +7,16 @@ from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
+import asyncio
 import structlog
 import uvicorn
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from core.config import get_settings
+from api.responses import MsgspecResponse
 from api.routes import assets, analysis, correlations, portfolio
+from services.data_collector import close_session
 
 # Configure structured logging
 structlog.configure(
@@ -34,6 +38,13 @@ structlog.configure(
 
 logger = structlog.get_logger()
 
+ROUTERS = (
+    (assets.router, "/api/v1/assets"),
+    (analysis.router, "/api/v1/analysis"),
+    (correlations.router, "/api/v1/correlations"),
+    (portfolio.router, "/api/v1/portfolio"),
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -45,10 +56,14 @@ async def lifespan(app: FastAPI):
     logger.info(f"Environment: {settings.environment}")
     logger.info(f"Debug mode: {settings.debug}")
     
+    # Worker threads for blocking data-source calls (yfinance) run via asyncio.to_thread
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=16))
+    
     yield
     
     # Shutdown logic
     logger.info("🛑 Shutting down CryptoAnalyzer API...")
+    await close_session()
 
 
 def create_application() -> FastAPI:
@@ -92,6 +107,7 @@ def create_application() -> FastAPI:
         ],
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        default_response_class=MsgspecResponse,
         lifespan=lifespan
     )
     
@@ -107,30 +123,9 @@ def create_application() -> FastAPI:
         expose_headers=["X-Total-Count", "X-Page-Count"]
     )
     
-    # Include routers
-    app.include_router(
-        assets.router,
-        prefix="/api/v1/assets",
-        tags=["assets"]
-    )
-    
-    app.include_router(
-        analysis.router,
-        prefix="/api/v1/analysis",
-        tags=["analysis"]
-    )
-    
-    app.include_router(
-        correlations.router,
-        prefix="/api/v1/correlations", 
-        tags=["correlations"]
-    )
-    
-    app.include_router(
-        portfolio.router,
-        prefix="/api/v1/portfolio",
-        tags=["portfolio"]
-    )
+    # Include routers (tags are declared on each router)
+    for router, prefix in ROUTERS:
+        app.include_router(router, prefix=prefix)
     
     return app
 
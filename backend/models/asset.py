@@ -2,11 +2,12 @@
 Pydantic models for asset data
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, List, Optional, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, validator
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+import msgspec
 
 
 class AssetType(str, Enum):
@@ -29,6 +30,13 @@ class TimeframeEnum(str, Enum):
     MAX = "max"
 
 
+class _DecimalJSONModel(BaseModel):
+    """Base model sharing a single Decimal JSON encoder"""
+    model_config = ConfigDict(
+        json_encoders={Decimal: lambda v: None if v is None else float(v)}
+    )
+
+
 class AssetInfo(BaseModel):
     """Basic asset information"""
     symbol: str = Field(..., description="Asset symbol (e.g., BTC, ETH, SPY)")
@@ -44,7 +52,7 @@ class AssetInfo(BaseModel):
         return v.upper()
 
 
-class PriceData(BaseModel):
+class PriceData(_DecimalJSONModel):
     """Current price data for an asset"""
     symbol: str = Field(..., description="Asset symbol")
     price: Decimal = Field(..., description="Current price in USD")
@@ -55,39 +63,58 @@ class PriceData(BaseModel):
     circulating_supply: Optional[Decimal] = Field(None, description="Circulating supply")
     total_supply: Optional[Decimal] = Field(None, description="Total supply")
     last_updated: datetime = Field(default_factory=datetime.utcnow)
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v) if v else None
-        }
 
 
-class HistoricalPricePoint(BaseModel):
-    """Single historical price point"""
+class HistoricalPricePointSchema(BaseModel):
+    """Documented shape of HistoricalPricePointMS (prices encoded as floats)"""
     timestamp: datetime = Field(..., description="Price timestamp")
-    open: Optional[Decimal] = Field(None, description="Opening price")
-    high: Optional[Decimal] = Field(None, description="High price")
-    low: Optional[Decimal] = Field(None, description="Low price")
-    close: Decimal = Field(..., description="Closing price")
-    volume: Optional[Decimal] = Field(None, description="Trading volume")
+    open: Optional[float] = Field(None, description="Opening price")
+    high: Optional[float] = Field(None, description="High price")
+    low: Optional[float] = Field(None, description="Low price")
+    close: float = Field(..., description="Closing price")
+    volume: Optional[float] = Field(None, description="Trading volume")
+
+
+class _SchemaFrom:
+    """Annotation documenting a msgspec Struct field with a pydantic model's JSON schema"""
     
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v) if v else None
-        }
+    def __init__(self, model):
+        self.model = model
+    
+    def __get_pydantic_json_schema__(self, core_schema, handler):
+        # Structs validate as plain isinstance checks, which have no JSON schema of their own
+        return handler(self.model.__pydantic_core_schema__)
+
+
+class HistoricalPricePointMS(msgspec.Struct, frozen=True, gc=False, kw_only=True):
+    """Single historical price point (msgspec struct used on the hot path)"""
+    timestamp: datetime
+    open: Optional[float] = None
+    high: Optional[float] = None
+    low: Optional[float] = None
+    close: float
+    volume: Optional[float] = None
 
 
 class HistoricalData(BaseModel):
     """Historical price data for an asset"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     symbol: str = Field(..., description="Asset symbol")
     timeframe: TimeframeEnum = Field(..., description="Data timeframe")
-    data: List[HistoricalPricePoint] = Field(..., description="Historical price points")
+    data: List[Annotated[HistoricalPricePointMS, _SchemaFrom(HistoricalPricePointSchema)]] = Field(
+        ..., description="Historical price points"
+    )
     total_points: int = Field(..., description="Total number of data points")
     start_date: datetime = Field(..., description="Start date of data")
     end_date: datetime = Field(..., description="End date of data")
+    
+    @field_serializer('data', when_used='json')
+    def serialize_data(self, data: List[HistoricalPricePointMS]):
+        return msgspec.to_builtins(data)
 
 
-class MarketSummary(BaseModel):
+class MarketSummary(_DecimalJSONModel):
     """Market summary statistics"""
     symbol: str = Field(..., description="Asset symbol")
     current_price: Decimal = Field(..., description="Current price")
@@ -104,28 +131,30 @@ class MarketSummary(BaseModel):
     ath_date: Optional[datetime] = Field(None, description="ATH date")
     atl: Optional[Decimal] = Field(None, description="All-time low")
     atl_date: Optional[datetime] = Field(None, description="ATL date")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v) if v else None
-        }
 
 
-class AssetListItem(BaseModel):
-    """Asset list item for search/browse endpoints"""
+class AssetListItemSchema(BaseModel):
+    """Documented shape of AssetListItem (market figures encoded as floats)"""
     symbol: str = Field(..., description="Asset symbol")
     name: str = Field(..., description="Asset name")
     asset_type: AssetType = Field(..., description="Asset type")
-    current_price: Optional[Decimal] = Field(None, description="Current price")
-    market_cap: Optional[Decimal] = Field(None, description="Market cap")
-    volume_24h: Optional[Decimal] = Field(None, description="24h volume")
-    price_change_percentage_24h: Optional[Decimal] = Field(None, description="24h change %")
+    current_price: Optional[float] = Field(None, description="Current price")
+    market_cap: Optional[float] = Field(None, description="Market cap")
+    volume_24h: Optional[float] = Field(None, description="24h volume")
+    price_change_percentage_24h: Optional[float] = Field(None, description="24h change %")
     logo_url: Optional[str] = Field(None, description="Asset logo")
-    
-    class Config:
-        json_encoders = {
-            Decimal: lambda v: float(v) if v else None
-        }
+
+
+class AssetListItem(msgspec.Struct, frozen=True, gc=False, kw_only=True):
+    """Asset list item for search/browse endpoints (display-only, floats)"""
+    symbol: str
+    name: str
+    asset_type: AssetType
+    current_price: Optional[float] = None
+    market_cap: Optional[float] = None
+    volume_24h: Optional[float] = None
+    price_change_percentage_24h: Optional[float] = None
+    logo_url: Optional[str] = None
 
 
 class AssetSearchRequest(BaseModel):
@@ -163,12 +192,18 @@ class AssetResponse(BaseModel):
 
 class PaginatedAssetResponse(BaseModel):
     """Paginated asset response"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    
     success: bool = Field(default=True)
-    data: List[AssetListItem] = Field(default_factory=list)
+    data: List[Annotated[AssetListItem, _SchemaFrom(AssetListItemSchema)]] = Field(default_factory=list)
     total: int = Field(default=0)
     page: int = Field(default=1)
     per_page: int = Field(default=20)
     total_pages: int = Field(default=0)
     has_next: bool = Field(default=False)
     has_prev: bool = Field(default=False)
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
\ No newline at end of file
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+    
+    @field_serializer('data', when_used='json')
+    def serialize_data(self, data: List[AssetListItem]):
+        return msgspec.to_builtins(data)
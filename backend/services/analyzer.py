@@ -4,13 +4,53 @@ Analysis service classes for financial calculations and technical analysis
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, timedelta
 from scipy import stats
 import structlog
 
+from services.calculator import (
+    _sorted_quantile, bulk_return_stats, ewma_var, macd_lines, rolling_var, rsi_wilder
+)
+
 logger = structlog.get_logger()
 
+# Volatility regimes reported by identify_volatility_regime, indexed by tally code
+VOLATILITY_REGIMES = ("normal_volatility", "high_volatility", "low_volatility", "insufficient_data")
+_REGIME_CODES = {regime: code for code, regime in enumerate(VOLATILITY_REGIMES)}
+
+# generate_signals evaluates recursive indicators over this many periods of history
+SIGNAL_TAIL_FACTOR = 10
+
+
+def _partition_quantile(values: np.ndarray, q: float) -> float:
+    """Single quantile with np.percentile's linear interpolation, via O(N) np.partition"""
+    lower = int(np.floor(q * (values.size - 1)))
+    upper = min(lower + 1, values.size - 1)
+    # Only the two interpolated positions need to be in sorted order
+    return float(_sorted_quantile(np.partition(values, (lower, upper)), q))
+
+
+class ReturnsCache:
+    """Returns converted to float64 once, with the statistics shared by the risk metrics"""
+    
+    __slots__ = ("returns", "mean", "var", "sorted")
+    
+    def __init__(self, returns: Union[np.ndarray, List[float]]):
+        self.returns = np.ascontiguousarray(returns, dtype=np.float64)
+        self.mean = float(self.returns.mean()) if self.returns.size else 0.0
+        self.var = float(self.returns.var(ddof=1)) if self.returns.size > 1 else 0.0
+        self.sorted = np.sort(self.returns)
+    
+    def quantile(self, q: float) -> float:
+        """Quantile with np.percentile's linear interpolation, read from the sorted returns"""
+        return float(_sorted_quantile(self.sorted, q))
+    
+    def tail_mean(self, threshold: float) -> float:
+        """Mean of the returns at or below threshold (0.0 if none)"""
+        count = int(np.searchsorted(self.sorted, threshold, side="right"))
+        return float(self.sorted[:count].mean()) if count else 0.0
+
 
 class PerformanceAnalyzer:
     """Class for performance and risk analysis calculations"""
@@ -18,27 +58,30 @@ class PerformanceAnalyzer:
     def __init__(self):
         self.risk_free_rate = 0.02  # 2% annual risk-free rate
     
-    def calculate_returns(self, prices: List[float]) -> List[float]:
+    def calculate_returns(self, prices: Union[np.ndarray, List[float]]) -> np.ndarray:
         """Calculate simple returns from price series"""
-        if len(prices) < 2:
-            return []
+        p = np.asarray(prices, dtype=np.float64)
+        if p.size < 2:
+            return np.empty(0, dtype=np.float64)
         
-        returns = []
-        for i in range(1, len(prices)):
-            if prices[i-1] != 0:
-                ret = (prices[i] - prices[i-1]) / prices[i-1]
-                returns.append(ret)
-            else:
-                returns.append(0)
+        prev = p[:-1]
+        nonzero = prev != 0
+        returns = np.empty_like(prev)
+        np.subtract(p[1:], prev, out=returns)
+        np.divide(returns, prev, out=returns, where=nonzero)
+        returns[~nonzero] = 0.0
         
         return returns
     
-    def calculate_log_returns(self, prices: List[float]) -> List[float]:
+    def calculate_log_returns(self, prices: Union[np.ndarray, List[float]]) -> np.ndarray:
         """Calculate logarithmic returns"""
-        if len(prices) < 2:
-            return []
+        p = np.asarray(prices, dtype=np.float64)
+        if p.size < 2:
+            return np.empty(0, dtype=np.float64)
         
-        return [np.log(prices[i] / prices[i-1]) for i in range(1, len(prices)) if prices[i-1] > 0]
+        # Skip periods with a non-positive previous price
+        mask = p[:-1] > 0
+        return np.log(p[1:][mask] / p[:-1][mask])
     
     def calculate_total_return(self, prices: List[float]) -> float:
         """Calculate total return over the period"""
@@ -49,7 +92,7 @@ class PerformanceAnalyzer:
     
     def calculate_annualized_return(self, returns: List[float], periods_per_year: int = 252) -> float:
         """Calculate annualized return"""
-        if not returns:
+        if len(returns) == 0:
             return 0.0
         
         avg_return = np.mean(returns)
@@ -67,53 +110,51 @@ class PerformanceAnalyzer:
         
         return vol * 100  # Return as percentage
     
-    def calculate_rolling_volatility(self, returns: List[float], window: int = 20) -> List[float]:
+    def calculate_rolling_volatility(self, returns: Union[np.ndarray, List[float]], window: int = 20) -> np.ndarray:
         """Calculate rolling volatility"""
-        if len(returns) < window:
-            return []
+        r = np.asarray(returns, dtype=np.float64)
+        if r.size < window:
+            return np.empty(0, dtype=np.float64)
         
-        rolling_vol = []
-        for i in range(window, len(returns) + 1):
-            window_returns = returns[i-window:i]
-            vol = np.std(window_returns, ddof=1) * np.sqrt(252) * 100
-            rolling_vol.append(vol)
+        if window > 1:
+            # O(N) running-moment kernel; clamp round-off below zero
+            rolling_vol = np.sqrt(np.maximum(rolling_var(r, window), 0.0))
+        else:
+            # Single-value windows have no sample std (NaN); the kernel would divide by zero
+            windows = np.lib.stride_tricks.sliding_window_view(r, window)
+            rolling_vol = windows.std(axis=1, ddof=1)
+        rolling_vol *= np.sqrt(252) * 100
         
         return rolling_vol
     
-    def calculate_sharpe_ratio(self, returns: List[float]) -> float:
+    def calculate_sharpe_ratio(self, returns: Union[np.ndarray, List[float]]) -> float:
         """Calculate Sharpe ratio"""
-        if len(returns) < 2:
+        r = np.asarray(returns, dtype=np.float64)
+        if r.size < 2:
             return 0.0
         
-        avg_return = np.mean(returns)
-        vol = np.std(returns, ddof=1)
+        avg_return = r.mean()
+        variance = r.var(ddof=1)
         
-        if vol == 0:
+        if variance == 0:
             return 0.0
         
-        # Annualize the ratio
-        annual_avg_return = (1 + avg_return) ** 252 - 1
-        annual_vol = vol * np.sqrt(252)
+        # Annualize the ratio; expm1/log1p keeps (1 + r)^252 - 1 accurate for small r
+        annual_avg_return = np.expm1(252 * np.log1p(avg_return))
+        annual_vol = np.sqrt(variance * 252)
         
-        return (annual_avg_return - self.risk_free_rate) / annual_vol
+        return float((annual_avg_return - self.risk_free_rate) / annual_vol)
     
-    def calculate_max_drawdown(self, prices: List[float]) -> float:
+    def calculate_max_drawdown(self, prices: Union[np.ndarray, List[float]]) -> float:
         """Calculate maximum drawdown"""
-        if len(prices) < 2:
+        p = np.asarray(prices, dtype=np.float64)
+        if p.size < 2:
             return 0.0
         
-        peak = prices[0]
-        max_dd = 0.0
-        
-        for price in prices[1:]:
-            if price > peak:
-                peak = price
-            
-            drawdown = (peak - price) / peak
-            if drawdown > max_dd:
-                max_dd = drawdown
+        peaks = np.maximum.accumulate(p)
+        drawdowns = (peaks - p) / peaks
         
-        return max_dd * 100  # Return as percentage
+        return float(drawdowns.max()) * 100  # Return as percentage
     
     def calculate_calmar_ratio(self, returns: List[float], prices: List[float]) -> float:
         """Calculate Calmar ratio (annual return / max drawdown)"""
@@ -128,39 +169,126 @@ class PerformanceAnalyzer:
         
         return annual_return / (max_dd / 100)
     
-    def calculate_var(self, returns: List[float], confidence_level: float = 0.95) -> float:
+    def calculate_var(self, returns: Union[np.ndarray, List[float]], confidence_level: float = 0.95) -> float:
         """Calculate Value at Risk"""
-        if len(returns) < 2:
+        r = np.asarray(returns, dtype=np.float64)
+        if r.size < 2:
             return 0.0
         
-        return np.percentile(returns, (1 - confidence_level) * 100) * 100
+        return _partition_quantile(r, 1 - confidence_level) * 100
     
-    def calculate_cvar(self, returns: List[float], confidence_level: float = 0.95) -> float:
+    def calculate_cvar(self, returns: Union[np.ndarray, List[float]], confidence_level: float = 0.95) -> float:
         """Calculate Conditional Value at Risk (Expected Shortfall)"""
-        if len(returns) < 2:
+        r = np.asarray(returns, dtype=np.float64)
+        if r.size < 2:
             return 0.0
         
-        var = self.calculate_var(returns, confidence_level) / 100
-        tail_returns = [r for r in returns if r <= var]
+        var = _partition_quantile(r, 1 - confidence_level)
+        tail_returns = r[r <= var]
         
-        if not tail_returns:
+        if not tail_returns.size:
             return 0.0
         
-        return np.mean(tail_returns) * 100
+        return float(tail_returns.mean()) * 100
     
-    def calculate_garch_volatility(self, returns: List[float]) -> float:
+    def analyze(
+        self, 
+        returns: Union[np.ndarray, List[float]], 
+        prices: Optional[Union[np.ndarray, List[float]]] = None
+    ) -> Dict[str, float]:
+        """Calculate the common return and risk metrics from a single ReturnsCache"""
+        cache = ReturnsCache(returns)
+        if cache.returns.size < 2:
+            metrics = {
+                "annualized_return": 0.0,
+                "volatility": 0.0,
+                "sharpe_ratio": 0.0,
+                "var_95": 0.0,
+                "var_99": 0.0,
+                "conditional_var": 0.0
+            }
+        else:
+            annual_vol = np.sqrt(cache.var * 252)
+            annual_avg_return = np.expm1(252 * np.log1p(cache.mean))
+            var_95 = cache.quantile(0.05)
+            
+            metrics = {
+                "annualized_return": float(annual_avg_return),
+                "volatility": float(annual_vol * 100),
+                "sharpe_ratio": float((annual_avg_return - self.risk_free_rate) / annual_vol) if cache.var != 0 else 0.0,
+                "var_95": var_95 * 100,
+                "var_99": cache.quantile(0.01) * 100,
+                "conditional_var": cache.tail_mean(var_95) * 100
+            }
+        
+        if prices is not None:
+            metrics["total_return"] = self.calculate_total_return(prices)
+            metrics["max_drawdown"] = self.calculate_max_drawdown(prices)
+            metrics["calmar_ratio"] = (
+                metrics["annualized_return"] / (metrics["max_drawdown"] / 100)
+                if metrics["max_drawdown"] != 0 else 0.0
+            )
+        
+        return metrics
+    
+    def bulk_analyze(self, returns_data: Dict[str, Union[np.ndarray, List[float]]]) -> Dict[str, Dict[str, float]]:
+        """Calculate risk metrics for many symbols at once
+        
+        Returns are stacked into a NaN-padded matrix and reduced row by row in a
+        single Numba kernel. Metric names and values match analyze().
+        """
+        if not returns_data:
+            return {}
+        
+        symbols = list(returns_data.keys())
+        rows = [np.asarray(returns_data[symbol], dtype=np.float64) for symbol in symbols]
+        lengths = np.array([row.size for row in rows], dtype=np.int64)
+        
+        matrix = np.full((len(rows), max(int(lengths.max()), 1)), np.nan)
+        for i, row in enumerate(rows):
+            matrix[i, :row.size] = row
+        
+        stats_matrix = bulk_return_stats(matrix, lengths)
+        
+        results = {}
+        for symbol, n, (mean, var, q05, q01, tail_mean, max_dd) in zip(symbols, lengths, stats_matrix):
+            if n < 2:
+                results[symbol] = {
+                    "annualized_return": 0.0,
+                    "volatility": 0.0,
+                    "sharpe_ratio": 0.0,
+                    "var_95": 0.0,
+                    "var_99": 0.0,
+                    "conditional_var": 0.0,
+                    "max_drawdown": 0.0
+                }
+                continue
+            
+            annual_vol = np.sqrt(var * 252)
+            annual_avg_return = np.expm1(252 * np.log1p(mean))
+            results[symbol] = {
+                "annualized_return": float(annual_avg_return),
+                "volatility": float(annual_vol * 100),
+                "sharpe_ratio": float((annual_avg_return - self.risk_free_rate) / annual_vol) if var != 0 else 0.0,
+                "var_95": float(q05) * 100,
+                "var_99": float(q01) * 100,
+                "conditional_var": float(tail_mean) * 100,
+                "max_drawdown": float(max_dd) * 100
+            }
+        
+        return results
+    
+    def calculate_garch_volatility(self, returns: Union[np.ndarray, List[float]]) -> float:
         """Simplified GARCH-like volatility calculation"""
         if len(returns) < 10:
             return self.calculate_volatility(returns)
         
         # Simple EWMA as GARCH approximation
         lambda_param = 0.94
-        ewma_var = np.var(returns[:10])
-        
-        for ret in returns[10:]:
-            ewma_var = lambda_param * ewma_var + (1 - lambda_param) * ret**2
+        r = np.asarray(returns, dtype=np.float64)
+        variance = ewma_var(r[10:], lambda_param, float(np.var(r[:10])))
         
-        return np.sqrt(ewma_var * 252) * 100
+        return np.sqrt(variance * 252) * 100
     
     def detect_volatility_clustering(self, returns: List[float]) -> Dict[str, Any]:
         """Detect volatility clustering patterns"""
@@ -208,21 +336,25 @@ class PerformanceAnalyzer:
         if not volatility_results:
             return {"regime": "unknown", "confidence": 0}
         
-        regimes = []
-        for symbol, analysis in volatility_results.items():
-            regimes.append(analysis.get("volatility_regime", "normal_volatility"))
+        # Tally regimes as small-int codes; unknown labels count as normal
+        codes = np.fromiter(
+            (_REGIME_CODES.get(analysis.get("volatility_regime", "normal_volatility"), 0)
+             for analysis in volatility_results.values()),
+            dtype=np.int8,
+            count=len(volatility_results)
+        )
+        counts = np.bincount(codes, minlength=len(VOLATILITY_REGIMES))
         
-        regime_counts = {}
-        for regime in regimes:
-            regime_counts[regime] = regime_counts.get(regime, 0) + 1
-        
-        dominant_regime = max(regime_counts, key=regime_counts.get)
-        confidence = regime_counts[dominant_regime] / len(regimes)
+        dominant = int(counts.argmax())
+        confidence = counts[dominant] / codes.size
         
         return {
-            "regime": dominant_regime,
-            "confidence": confidence,
-            "regime_distribution": regime_counts
+            "regime": VOLATILITY_REGIMES[dominant],
+            "confidence": float(confidence),
+            "regime_distribution": {
+                VOLATILITY_REGIMES[code]: int(count)
+                for code, count in enumerate(counts.tolist()) if count
+            }
         }
 
 
@@ -236,12 +368,32 @@ class TechnicalAnalyzer:
         """
         self.data = data.copy()
         self.data.set_index('timestamp', inplace=True)
+        
+        # Contiguous float32 copies of the OHLCV columns for the indicator math.
+        # Halves memory traffic; reductions accumulate in float64 and reported
+        # prices come from the original float64 columns.
+        self._close = np.ascontiguousarray(self.data['close'].to_numpy(), dtype=np.float32)
+        self._high = np.ascontiguousarray(self.data['high'].to_numpy(), dtype=np.float32)
+        self._low = np.ascontiguousarray(self.data['low'].to_numpy(), dtype=np.float32)
+        self._volume = (
+            np.ascontiguousarray(self.data['volume'].to_numpy(), dtype=np.float32)
+            if 'volume' in self.data.columns else None
+        )
+        self._current_price = float(self.data['close'].iloc[-1])
+    
+    def _rolling_mean(self, values: np.ndarray, period: int) -> np.ndarray:
+        """Rolling mean aligned with the input (NaN until the window is full)"""
+        out = np.full(values.shape[0], np.nan)
+        if values.shape[0] >= period:
+            windows = np.lib.stride_tricks.sliding_window_view(values, period)
+            out[period - 1:] = windows.mean(axis=1, dtype=np.float64)
+        return out
     
     def calculate_sma(self, period: int = 20) -> Dict[str, Any]:
         """Calculate Simple Moving Average"""
-        sma = self.data['close'].rolling(window=period).mean()
-        current_sma = sma.iloc[-1] if not sma.empty else None
-        current_price = self.data['close'].iloc[-1]
+        sma = self._rolling_mean(self._close, period)
+        current_sma = sma[-1] if sma.size else None
+        current_price = self._current_price
         
         return {
             "values": sma.tolist(),
@@ -254,7 +406,7 @@ class TechnicalAnalyzer:
         """Calculate Exponential Moving Average"""
         ema = self.data['close'].ewm(span=period).mean()
         current_ema = ema.iloc[-1] if not ema.empty else None
-        current_price = self.data['close'].iloc[-1]
+        current_price = self._current_price
         
         return {
             "values": ema.tolist(),
@@ -264,55 +416,26 @@ class TechnicalAnalyzer:
         }
     
     def calculate_rsi(self, period: int = 14) -> Dict[str, Any]:
-        """Calculate Relative Strength Index"""
-        delta = self.data['close'].diff()
-        gain = delta.where(delta > 0, 0)
-        loss = -delta.where(delta < 0, 0)
-        
-        avg_gain = gain.rolling(window=period).mean()
-        avg_loss = loss.rolling(window=period).mean()
+        """Calculate Relative Strength Index (Wilder's smoothing)"""
+        rsi = rsi_wilder(self._close, period)
         
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        current_rsi = rsi.iloc[-1] if not rsi.empty else 50
-        
-        # Generate signal
-        if current_rsi > 70:
-            signal = "overbought"
-        elif current_rsi < 30:
-            signal = "oversold"
-        else:
-            signal = "neutral"
+        current_rsi = rsi[-1] if rsi.size else 50
         
         return {
             "values": rsi.tolist(),
             "current_value": current_rsi,
-            "signal": signal,
+            "signal": self._rsi_signal(current_rsi),
             "overbought_level": 70,
             "oversold_level": 30
         }
     
     def calculate_macd(self, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, Any]:
         """Calculate MACD (Moving Average Convergence Divergence)"""
-        ema_fast = self.data['close'].ewm(span=fast).mean()
-        ema_slow = self.data['close'].ewm(span=slow).mean()
-        
-        macd_line = ema_fast - ema_slow
-        signal_line = macd_line.ewm(span=signal).mean()
-        histogram = macd_line - signal_line
-        
-        current_macd = macd_line.iloc[-1] if not macd_line.empty else 0
-        current_signal = signal_line.iloc[-1] if not signal_line.empty else 0
-        current_histogram = histogram.iloc[-1] if not histogram.empty else 0
-        
-        # Generate signal
-        if current_macd > current_signal and current_histogram > 0:
-            macd_signal = "bullish"
-        elif current_macd < current_signal and current_histogram < 0:
-            macd_signal = "bearish"
-        else:
-            macd_signal = "neutral"
+        macd_line, signal_line, histogram = macd_lines(self._close, fast, slow, signal)
+        
+        current_macd = macd_line[-1] if macd_line.size else 0
+        current_signal = signal_line[-1] if signal_line.size else 0
+        current_histogram = histogram[-1] if histogram.size else 0
         
         return {
             "macd_line": macd_line.tolist(),
@@ -321,29 +444,26 @@ class TechnicalAnalyzer:
             "current_macd": current_macd,
             "current_signal": current_signal,
             "current_histogram": current_histogram,
-            "signal": macd_signal
+            "signal": self._macd_signal(current_macd, current_signal, current_histogram)
         }
     
     def calculate_bollinger_bands(self, period: int = 20, std_dev: int = 2) -> Dict[str, Any]:
         """Calculate Bollinger Bands"""
-        sma = self.data['close'].rolling(window=period).mean()
-        std = self.data['close'].rolling(window=period).std()
+        # Mean and sample std from the same windowed view, NaN until the window is full
+        sma = np.full(self._close.shape[0], np.nan)
+        std = np.full(self._close.shape[0], np.nan)
+        if self._close.shape[0] >= period:
+            windows = np.lib.stride_tricks.sliding_window_view(self._close, period)
+            sma[period - 1:] = windows.mean(axis=1, dtype=np.float64)
+            std[period - 1:] = windows.std(axis=1, ddof=1, dtype=np.float64)
         
         upper_band = sma + (std * std_dev)
         lower_band = sma - (std * std_dev)
         
-        current_price = self.data['close'].iloc[-1]
-        current_upper = upper_band.iloc[-1] if not upper_band.empty else current_price
-        current_lower = lower_band.iloc[-1] if not lower_band.empty else current_price
-        current_sma = sma.iloc[-1] if not sma.empty else current_price
-        
-        # Generate signal
-        if current_price > current_upper:
-            bb_signal = "overbought"
-        elif current_price < current_lower:
-            bb_signal = "oversold"
-        else:
-            bb_signal = "neutral"
+        current_price = self._current_price
+        current_upper = upper_band[-1] if upper_band.size else current_price
+        current_lower = lower_band[-1] if lower_band.size else current_price
+        current_sma = sma[-1] if sma.size else current_price
         
         return {
             "upper_band": upper_band.tolist(),
@@ -352,27 +472,32 @@ class TechnicalAnalyzer:
             "current_upper": current_upper,
             "current_middle": current_sma,
             "current_lower": current_lower,
-            "signal": bb_signal,
+            "signal": self._bollinger_signal(current_price, current_upper, current_lower),
             "bandwidth": ((current_upper - current_lower) / current_sma) * 100 if current_sma != 0 else 0
         }
     
     def find_support_resistance(self, window: int = 20) -> Dict[str, Any]:
         """Find support and resistance levels"""
-        highs = self.data['high'].rolling(window=window, center=True).max()
-        lows = self.data['low'].rolling(window=window, center=True).min()
-        
-        # Find local peaks and troughs
+        # Find local peaks and troughs: points equal to their centered window max/min
         resistance_levels = []
         support_levels = []
         
-        for i in range(window, len(self.data) - window):
-            if self.data['high'].iloc[i] == highs.iloc[i]:
-                resistance_levels.append(self.data['high'].iloc[i])
-            if self.data['low'].iloc[i] == lows.iloc[i]:
-                support_levels.append(self.data['low'].iloc[i])
+        n = self._high.shape[0]
+        if n > 2 * window:
+            highs = np.lib.stride_tricks.sliding_window_view(self._high, window).max(axis=1)
+            lows = np.lib.stride_tricks.sliding_window_view(self._low, window).min(axis=1)
+            
+            # A centered window at i starts at i - window // 2
+            candidates = slice(window, n - window)
+            centered = slice(window - window // 2, n - window - window // 2)
+            is_resistance = self._high[candidates] == highs[centered]
+            is_support = self._low[candidates] == lows[centered]
+            # Report levels at full precision from the float64 columns
+            resistance_levels = self.data['high'].to_numpy()[candidates][is_resistance].tolist()
+            support_levels = self.data['low'].to_numpy()[candidates][is_support].tolist()
         
         # Get current levels
-        current_price = self.data['close'].iloc[-1]
+        current_price = self._current_price
         
         # Find nearest support and resistance
         resistance_above = [r for r in resistance_levels if r > current_price]
@@ -389,21 +514,79 @@ class TechnicalAnalyzer:
             "current_price": current_price
         }
     
+    @staticmethod
+    def _rsi_signal(rsi: float) -> str:
+        """Classify an RSI reading"""
+        if rsi > 70:
+            return "overbought"
+        elif rsi < 30:
+            return "oversold"
+        return "neutral"
+    
+    @staticmethod
+    def _macd_signal(macd: float, signal: float, histogram: float) -> str:
+        """Classify the current MACD state"""
+        if macd > signal and histogram > 0:
+            return "bullish"
+        elif macd < signal and histogram < 0:
+            return "bearish"
+        return "neutral"
+    
+    @staticmethod
+    def _bollinger_signal(price: float, upper: float, lower: float) -> str:
+        """Classify price against the Bollinger Bands"""
+        if price > upper:
+            return "overbought"
+        elif price < lower:
+            return "oversold"
+        return "neutral"
+    
+    def _signal_tail(self, period: int) -> np.ndarray:
+        """Trailing closes long enough for a recursive indicator to converge"""
+        return self._close[-SIGNAL_TAIL_FACTOR * period:]
+    
+    def _last_sma(self, period: int = 20) -> float:
+        """SMA of the last bar only"""
+        return self._close[-period:].mean(dtype=np.float64) if self._close.size >= period else np.nan
+    
+    def _last_ema(self, period: int = 20) -> float:
+        """EMA of the last bar only"""
+        # Same weighting as ewm(span=period).mean() (adjust=True), over the tail only
+        tail = self._signal_tail(period)
+        weights = (1 - 2 / (period + 1)) ** np.arange(tail.size - 1, -1, -1)
+        return np.dot(weights, tail) / weights.sum()
+    
+    def _last_bollinger(self, period: int = 20, std_dev: int = 2) -> Tuple[float, float]:
+        """Upper and lower Bollinger Bands of the last bar only"""
+        if self._close.size < period:
+            return np.nan, np.nan
+        window = self._close[-period:]
+        mid, std = window.mean(dtype=np.float64), window.std(ddof=1, dtype=np.float64)
+        return mid + std * std_dev, mid - std * std_dev
+    
     def generate_signals(self, indicators: List[str]) -> Dict[str, str]:
-        """Generate combined trading signals"""
+        """Generate combined trading signals
+        
+        Only the last bar matters here, so each indicator is evaluated over a
+        short trailing window instead of building its full series.
+        """
         signals = {}
+        current_price = self._current_price
         
         for indicator in indicators:
             if indicator == "sma":
-                signals["sma"] = self.calculate_sma()["signal"]
+                signals["sma"] = "bullish" if current_price > self._last_sma() else "bearish"
             elif indicator == "ema":
-                signals["ema"] = self.calculate_ema()["signal"]
+                signals["ema"] = "bullish" if current_price > self._last_ema() else "bearish"
             elif indicator == "rsi":
-                signals["rsi"] = self.calculate_rsi()["signal"]
+                rsi = rsi_wilder(self._signal_tail(14), 14)
+                signals["rsi"] = self._rsi_signal(rsi[-1] if rsi.size else 50)
             elif indicator == "macd":
-                signals["macd"] = self.calculate_macd()["signal"]
+                macd_line, signal_line, histogram = macd_lines(self._signal_tail(26), 12, 26, 9)
+                signals["macd"] = self._macd_signal(macd_line[-1], signal_line[-1], histogram[-1])
             elif indicator == "bollinger":
-                signals["bollinger"] = self.calculate_bollinger_bands()["signal"]
+                upper, lower = self._last_bollinger()
+                signals["bollinger"] = self._bollinger_signal(current_price, upper, lower)
         
         # Overall signal
         bullish_count = sum(1 for signal in signals.values() if signal == "bullish")
@@ -420,20 +603,21 @@ class TechnicalAnalyzer:
     
     def assess_sentiment(self) -> Dict[str, Any]:
         """Assess market sentiment based on technical indicators"""
-        current_price = self.data['close'].iloc[-1]
+        close = self._close
+        current_price = self._current_price
         
         # Price momentum
-        price_change_1d = ((current_price - self.data['close'].iloc[-2]) / self.data['close'].iloc[-2]) * 100 if len(self.data) > 1 else 0
-        price_change_5d = ((current_price - self.data['close'].iloc[-6]) / self.data['close'].iloc[-6]) * 100 if len(self.data) > 5 else 0
+        price_change_1d = ((current_price - float(close[-2])) / float(close[-2])) * 100 if close.size > 1 else 0
+        price_change_5d = ((current_price - float(close[-6])) / float(close[-6])) * 100 if close.size > 5 else 0
         
         # Volume analysis
-        avg_volume = self.data['volume'].tail(20).mean() if 'volume' in self.data.columns else 0
-        current_volume = self.data['volume'].iloc[-1] if 'volume' in self.data.columns else 0
+        avg_volume = float(self._volume[-20:].mean(dtype=np.float64)) if self._volume is not None else 0
+        current_volume = float(self._volume[-1]) if self._volume is not None else 0
         volume_ratio = current_volume / avg_volume if avg_volume > 0 else 1
         
         # Volatility
-        returns = self.data['close'].pct_change().dropna()
-        volatility = returns.std() * np.sqrt(252) * 100 if len(returns) > 1 else 0
+        returns = np.diff(close) / close[:-1]
+        volatility = float(returns.std(ddof=1, dtype=np.float64)) * np.sqrt(252) * 100 if returns.size > 1 else 0
         
         # Sentiment score calculation
         sentiment_score = 0
@@ -515,24 +699,30 @@ class CorrelationAnalyzer:
             for asset2 in correlation_matrix.columns:
                 correlation_dict[asset1][asset2] = correlation_matrix.loc[asset1, asset2]
         
-        # Find strongest correlations
-        strong_correlations = []
-        for asset1 in correlation_matrix.columns:
-            for asset2 in correlation_matrix.columns:
-                if asset1 != asset2:
-                    corr_value = correlation_matrix.loc[asset1, asset2]
-                    if abs(corr_value) > 0.7:  # Strong correlation threshold
-                        strong_correlations.append({
-                            "asset1": asset1,
-                            "asset2": asset2,
-                            "correlation": corr_value,
-                            "strength": "strong" if abs(corr_value) > 0.8 else "moderate"
-                        })
+        # Find strongest correlations (each pair once, from the upper triangle)
+        columns = correlation_matrix.columns.to_numpy()
+        rows, cols = np.triu_indices_from(correlation_matrix.values, k=1)
+        pair_values = correlation_matrix.values[rows, cols]
+        strong = np.abs(pair_values) > 0.7  # Strong correlation threshold
+        
+        strong_correlations = [
+            {
+                "asset1": asset1,
+                "asset2": asset2,
+                "correlation": corr_value,
+                "strength": "strong" if abs(corr_value) > 0.8 else "moderate"
+            }
+            for asset1, asset2, corr_value in zip(
+                columns[rows[strong]].tolist(),
+                columns[cols[strong]].tolist(),
+                pair_values[strong].tolist()
+            )
+        ]
         
         return {
             "correlation_matrix": correlation_dict,
             "strong_correlations": strong_correlations,
-            "average_correlation": correlation_matrix.values[np.triu_indices_from(correlation_matrix.values, 1)].mean(),
+            "average_correlation": pair_values.mean(),
             "analysis_date": datetime.utcnow().isoformat()
         }
     
@@ -571,19 +761,26 @@ class CorrelationAnalyzer:
         if not rolling_corr:
             return {"stable": False, "reason": "insufficient_data"}
         
-        corr_std = np.std(rolling_corr)
-        corr_mean = np.mean(rolling_corr)
+        rc = np.asarray(rolling_corr, dtype=np.float64)
+        corr_std = rc.std()
+        corr_mean = rc.mean()
         
         # Stability criteria
         is_stable = corr_std < 0.2  # Standard deviation threshold
         
+        # Trend compares the mean of the last 5 windows with the 5 before them
+        if rc.size > 10:
+            trend = "increasing" if rc[-5:].mean() > rc[-10:-5].mean() else "decreasing"
+        else:
+            trend = "stable"
+        
         return {
             "stable": is_stable,
             "mean_correlation": corr_mean,
             "correlation_volatility": corr_std,
             "stability_score": 1 - min(corr_std / 0.5, 1),  # Normalized stability score
-            "recent_correlation": rolling_corr[-1] if rolling_corr else 0,
-            "correlation_trend": "increasing" if len(rolling_corr) > 10 and rolling_corr[-5:] > rolling_corr[-10:-5] else "decreasing" if len(rolling_corr) > 10 else "stable"
+            "recent_correlation": rc[-1],
+            "correlation_trend": trend
         }
 
 
@@ -606,26 +803,26 @@ class RiskAnalyzer:
         # Create returns DataFrame
         df = pd.DataFrame(returns_data)
         
-        # Calculate portfolio returns
-        portfolio_returns = []
-        for i in range(len(df)):
-            port_return = sum(df.iloc[i][asset] * weights.get(asset, 0) for asset in df.columns)
-            portfolio_returns.append(port_return)
+        # Calculate portfolio returns as a single matrix-vector product
+        assets = list(df.columns)
+        returns_matrix = df[assets].to_numpy(dtype=np.float64)
+        weight_vector = np.array([weights.get(asset, 0.0) for asset in assets], dtype=np.float64)
+        portfolio_returns = returns_matrix @ weight_vector
         
         # Calculate VaR
         var = np.percentile(portfolio_returns, (1 - confidence_level) * 100)
         
         # Calculate Expected Shortfall (CVaR)
-        tail_returns = [r for r in portfolio_returns if r <= var]
-        cvar = np.mean(tail_returns) if tail_returns else var
+        tail_returns = portfolio_returns[portfolio_returns <= var]
+        cvar = tail_returns.mean() if tail_returns.size else var
         
         return {
             "var": var * 100,  # Convert to percentage
             "cvar": cvar * 100,
             "confidence_level": confidence_level,
-            "portfolio_volatility": np.std(portfolio_returns) * np.sqrt(252) * 100,
-            "worst_return": min(portfolio_returns) * 100,
-            "best_return": max(portfolio_returns) * 100
+            "portfolio_volatility": portfolio_returns.std() * np.sqrt(252) * 100,
+            "worst_return": portfolio_returns.min() * 100,
+            "best_return": portfolio_returns.max() * 100
         }
     
     def calculate_beta(self, asset_returns: List[float], market_returns: List[float]) -> float:
@@ -633,17 +830,17 @@ class RiskAnalyzer:
         if len(asset_returns) != len(market_returns) or len(asset_returns) < 2:
             return 1.0
         
-        # Calculate covariance and variance
-        asset_array = np.array(asset_returns)
-        market_array = np.array(market_returns)
-        
-        covariance = np.cov(asset_array, market_array)[0, 1]
-        market_variance = np.var(market_array, ddof=1)
+        # Covariance over variance from centered dot products (ddof cancels)
+        asset_centered = np.asarray(asset_returns, dtype=np.float64)
+        asset_centered = asset_centered - asset_centered.mean()
+        market_centered = np.asarray(market_returns, dtype=np.float64)
+        market_centered = market_centered - market_centered.mean()
         
-        if market_variance == 0:
+        market_ss = np.dot(market_centered, market_centered)
+        if market_ss == 0:
             return 1.0
         
-        beta = covariance / market_variance
+        beta = float(np.dot(asset_centered, market_centered) / market_ss)
         return beta
     
     def assess_risk_profile(self, returns: List[float]) -> Dict[str, Any]:
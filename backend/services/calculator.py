@@ -0,0 +1,182 @@
+"""
+Compiled numeric kernels used by the analysis services
+
+Numba is a required dependency (pinned in requirements.txt): without it these
+loops would run as plain Python, far slower than the NumPy code they replace.
+Kernels are compiled without parallel=True, since Numba's default threading
+layer is not safe when called from several threads at once.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def rolling_var(r: np.ndarray, w: int) -> np.ndarray:
+    """Rolling sample variance in O(N) using running sum and sum of squares"""
+    n = r.shape[0]
+    out = np.empty(n - w + 1, dtype=np.float64)
+
+    s1 = 0.0
+    s2 = 0.0
+    for i in range(w):
+        s1 += r[i]
+        s2 += r[i] * r[i]
+    out[0] = (s2 - s1 * s1 / w) / (w - 1)
+
+    for i in range(w, n):
+        old = r[i - w]
+        new = r[i]
+        s1 += new - old
+        s2 += new * new - old * old
+        out[i - w + 1] = (s2 - s1 * s1 / w) / (w - 1)
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def ewma_var(r: np.ndarray, lam: float, init: float) -> float:
+    """Final value of the EWMA variance recurrence v = lam*v + (1-lam)*x^2"""
+    v = init
+    for x in r:
+        v = lam * v + (1.0 - lam) * x * x
+    return v
+
+
+@njit(cache=True, fastmath=True)
+def rsi_wilder(close: np.ndarray, period: int) -> np.ndarray:
+    """RSI with Wilder's smoothing, aligned with close (NaN for the first period values)"""
+    n = close.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    out[:min(period, n)] = np.nan
+    if n <= period:
+        return out
+
+    # Seed with the simple average of the first period gains/losses
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+
+    for i in range(period, n):
+        if i > period:
+            delta = close[i] - close[i - 1]
+            gain = delta if delta > 0 else 0.0
+            loss = -delta if delta < 0 else 0.0
+            avg_gain = (avg_gain * (period - 1) + gain) / period
+            avg_loss = (avg_loss * (period - 1) + loss) / period
+        if avg_loss == 0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def macd_lines(close: np.ndarray, fast: int, slow: int, signal: int):
+    """MACD, signal and histogram lines in one pass over close
+
+    Each EMA matches pandas ``ewm(span=...).mean()`` (adjust=True), kept as
+    running weighted sums ``num / den`` so every step is O(1).
+    """
+    n = close.shape[0]
+    macd = np.empty(n, dtype=np.float64)
+    sig = np.empty(n, dtype=np.float64)
+    hist = np.empty(n, dtype=np.float64)
+
+    decay_fast = 1.0 - 2.0 / (fast + 1)
+    decay_slow = 1.0 - 2.0 / (slow + 1)
+    decay_sig = 1.0 - 2.0 / (signal + 1)
+
+    num_fast = den_fast = 0.0
+    num_slow = den_slow = 0.0
+    num_sig = den_sig = 0.0
+    for i in range(n):
+        x = close[i]
+        num_fast = x + decay_fast * num_fast
+        den_fast = 1.0 + decay_fast * den_fast
+        num_slow = x + decay_slow * num_slow
+        den_slow = 1.0 + decay_slow * den_slow
+        m = num_fast / den_fast - num_slow / den_slow
+
+        num_sig = m + decay_sig * num_sig
+        den_sig = 1.0 + decay_sig * den_sig
+        s = num_sig / den_sig
+
+        macd[i] = m
+        sig[i] = s
+        hist[i] = m - s
+
+    return macd, sig, hist
+
+
+@njit(cache=True)
+def _sorted_quantile(sorted_r: np.ndarray, q: float) -> float:
+    """Quantile with np.percentile's linear interpolation on an already sorted array
+
+    Only the two positions around q * (n - 1) are read, so an array partitioned
+    around them (np.partition) works as well.
+    """
+    position = q * (sorted_r.shape[0] - 1)
+    lower = int(np.floor(position))
+    upper = min(lower + 1, sorted_r.shape[0] - 1)
+    return sorted_r[lower] + (sorted_r[upper] - sorted_r[lower]) * (position - lower)
+
+
+@njit(cache=True)
+def bulk_return_stats(matrix: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Per-row return statistics for a NaN-padded (symbols x periods) returns matrix
+
+    Columns: mean, sample variance, 5% quantile, 1% quantile, mean of the
+    returns at or below the 5% quantile, and max drawdown of the compounded
+    returns. Rows with fewer than two returns are left as zeros.
+    """
+    n_rows = matrix.shape[0]
+    out = np.zeros((n_rows, 6), dtype=np.float64)
+
+    for i in range(n_rows):
+        n = lengths[i]
+        if n < 2:
+            continue
+        r = matrix[i, :n]
+
+        mean = r.mean()
+        ss = 0.0
+        wealth = 1.0
+        peak = 1.0
+        max_dd = 0.0
+        for j in range(n):
+            d = r[j] - mean
+            ss += d * d
+            wealth *= 1.0 + r[j]
+            if wealth > peak:
+                peak = wealth
+            dd = (peak - wealth) / peak
+            if dd > max_dd:
+                max_dd = dd
+
+        sorted_r = np.sort(r)
+        q05 = _sorted_quantile(sorted_r, 0.05)
+        tail_sum = 0.0
+        tail_count = 0
+        for j in range(n):
+            if sorted_r[j] > q05:
+                break
+            tail_sum += sorted_r[j]
+            tail_count += 1
+
+        out[i, 0] = mean
+        out[i, 1] = ss / (n - 1)
+        out[i, 2] = q05
+        out[i, 3] = _sorted_quantile(sorted_r, 0.01)
+        out[i, 4] = tail_sum / tail_count if tail_count else 0.0
+        out[i, 5] = max_dd
+
+    return out
@@ -3,24 +3,291 @@ Data collection service for fetching market data from multiple sources
 """
 
 import asyncio
+import time
 import aiohttp
-import yfinance as yf
+import httpx
+import msgspec
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Union
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Mapping, Optional, Any, Tuple, Union
 from datetime import datetime, timedelta
 from decimal import Decimal
+from pathlib import Path
 import structlog
 from dataclasses import dataclass
 
 from core.config import get_settings, ASSET_MAPPINGS, DATA_SOURCES, TIME_PERIODS
 from models.asset import (
-    PriceData, HistoricalData, HistoricalPricePoint, MarketSummary,
+    PriceData, HistoricalData, HistoricalPricePointMS, MarketSummary,
     AssetType, TimeframeEnum
 )
 
+if TYPE_CHECKING:
+    import yfinance as yf
+
 logger = structlog.get_logger()
 
+# aiohttp decodes brotli responses only when the brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+_D_ZERO = Decimal(0)
+
+
+def D(value: Any) -> Decimal:
+    """Convert a raw API/pandas number to Decimal (None and 0 become 0)"""
+    if not value:
+        return _D_ZERO
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+# Application-wide HTTP session, reused across requests for keep-alive
+_SHARED_SESSION: Optional[aiohttp.ClientSession] = None
+
+# Event loop the shared clients were created on (they cannot be used from another one)
+_BOUND_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _bind_running_loop() -> None:
+    """Forget clients and limiters created on a previous event loop, e.g. by an earlier asyncio.run()"""
+    global _BOUND_LOOP, _SHARED_SESSION
+    loop = asyncio.get_running_loop()
+    if loop is not _BOUND_LOOP:
+        _BOUND_LOOP = loop
+        _SHARED_SESSION = None
+        _HTTP2_CLIENTS.clear()
+        _RATE_LIMITERS.clear()  # their asyncio semaphore and lock belong to the old loop
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared aiohttp session for the running loop, creating it on first use"""
+    global _SHARED_SESSION
+    _bind_running_loop()
+    if _SHARED_SESSION is None or _SHARED_SESSION.closed:
+        _SHARED_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=8,  # keep one slow host from holding the whole pool
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                keepalive_timeout=30,
+                enable_cleanup_closed=True
+            ),
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={"User-Agent": "CryptoAnalyzer/1.0", "Accept-Encoding": ACCEPT_ENCODING}
+        )
+    return _SHARED_SESSION
+
+
+_HTTP2_CLIENTS: Dict[str, httpx.AsyncClient] = {}
+
+
+def get_http2_client(source: str) -> Optional[httpx.AsyncClient]:
+    """Return the shared HTTP/2 client for a source, or None to use the aiohttp session
+    
+    HTTP/2 is opt-in: it needs ``http2_enabled`` (HTTP2_ENABLED) in the
+    settings and ``"http2": True`` on the source in DATA_SOURCES. All of the
+    source's concurrent requests are then multiplexed over a single connection;
+    otherwise every request goes through the aiohttp session.
+    """
+    if not get_settings().http2_enabled or not DATA_SOURCES.get(source, {}).get("http2"):
+        return None
+    
+    _bind_running_loop()
+    client = _HTTP2_CLIENTS.get(source)
+    if client is None or client.is_closed:
+        client = _HTTP2_CLIENTS[source] = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            headers={"User-Agent": "CryptoAnalyzer/1.0"}
+        )
+    return client
+
+
+class HostRateLimiter:
+    """Per-host concurrency cap plus a token bucket refilled at the host's rate limit"""
+    
+    def __init__(self, requests_per_minute: int, max_concurrency: int):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max(requests_per_minute, 1))
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.lock = asyncio.Lock()
+    
+    async def acquire_token(self) -> None:
+        """Wait until a request may be sent"""
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                
+                wait = max(self.blocked_until - now, 0.0)
+                if not wait and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep(wait or (1 - self.tokens) / self.rate)
+    
+    def back_off(self, delay: float) -> None:
+        """Pause all requests to the host, e.g. after a 429 response"""
+        self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        self.tokens = 0.0
+    
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        try:
+            await self.acquire_token()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.semaphore.release()
+
+
+# Shared like the session (and bound to the same loop), keyed by data source name
+_RATE_LIMITERS: Dict[str, HostRateLimiter] = {}
+
+# Retry policy for rate-limited / failing upstream requests
+MAX_RETRIES = 3
+MAX_BACKOFF_SECONDS = 30
+
+
+def get_rate_limiter(source: str) -> HostRateLimiter:
+    """Return the rate limiter for a data source on the running loop, creating it on first use"""
+    _bind_running_loop()
+    limiter = _RATE_LIMITERS.get(source)
+    if limiter is None:
+        config = DATA_SOURCES[source]
+        limiter = _RATE_LIMITERS[source] = HostRateLimiter(
+            requests_per_minute=config.get("rate_limit", 60),
+            max_concurrency=config.get("max_concurrency", 10)
+        )
+    return limiter
+
+
+# yfinance caches: Ticker objects live for the process, results for a short TTL
+INFO_TTL_SECONDS = 300
+HISTORY_TTL_SECONDS = 30
+
+_TICKER_CACHE: Dict[str, "yf.Ticker"] = {}
+_INFO_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_HISTORY_CACHE: Dict[Tuple[str, Any], Tuple[float, pd.DataFrame]] = {}
+
+
+def yf_ticker(symbol: str) -> "yf.Ticker":
+    """Return a cached yfinance Ticker for the symbol
+    
+    yfinance is imported here on first use so it stays off the API's startup path.
+    """
+    ticker = _TICKER_CACHE.get(symbol)
+    if ticker is None:
+        import yfinance as yf
+        ticker = _TICKER_CACHE[symbol] = yf.Ticker(symbol)
+    return ticker
+
+
+async def _yf_info(ticker: "yf.Ticker") -> Dict[str, Any]:
+    """Read yfinance ticker info in a worker thread (it performs blocking HTTP)"""
+    cached = _INFO_CACHE.get(ticker.ticker)
+    if cached and time.monotonic() - cached[0] < INFO_TTL_SECONDS:
+        return cached[1]
+    
+    info = await asyncio.to_thread(lambda: ticker.info)
+    _INFO_CACHE[ticker.ticker] = (time.monotonic(), info)
+    return info
+
+
+async def _yf_history(ticker: "yf.Ticker", cache_key: Any = None, **kwargs) -> pd.DataFrame:
+    """Run yfinance history() in a worker thread (it performs blocking HTTP)
+    
+    Results are cached per ticker under cache_key, or under the call's keyword
+    arguments when no key is given.
+    """
+    key = (ticker.ticker, cache_key if cache_key is not None else tuple(sorted(kwargs.items())))
+    cached = _HISTORY_CACHE.get(key)
+    if cached and time.monotonic() - cached[0] < HISTORY_TTL_SECONDS:
+        return cached[1]
+    
+    history = await asyncio.to_thread(ticker.history, **kwargs)
+    _HISTORY_CACHE[key] = (time.monotonic(), history)
+    return history
+
+
+class CachedHistory(msgspec.Struct, kw_only=True):
+    """Historical points persisted on disk with the validators they were served with"""
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    points: List[HistoricalPricePointMS]
+
+
+_HISTORY_ENCODER = msgspec.msgpack.Encoder()
+_HISTORY_DECODER = msgspec.msgpack.Decoder(CachedHistory)
+
+
+def _history_cache_path(source: str, symbol: str, timeframe: str, day: str) -> Path:
+    """Cache file for one (symbol, timeframe, day) entry"""
+    cache_dir = Path(get_settings().historical_cache_dir)
+    return cache_dir / f"{source}_{symbol.upper()}_{timeframe}_{day}.msgpack"
+
+
+def _read_cached_history(path: Path) -> Optional[CachedHistory]:
+    try:
+        return _HISTORY_DECODER.decode(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, msgspec.DecodeError) as e:
+        logger.warning(f"Ignoring unreadable history cache {path.name}: {str(e)}")
+        return None
+
+
+def _write_cached_history(path: Path, entry: CachedHistory) -> None:
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(_HISTORY_ENCODER.encode(entry))
+        tmp_path.replace(path)
+        
+        # Only today's file is ever read back, so drop earlier days for this key
+        prefix = path.name.rsplit("_", 1)[0] + "_"
+        for stale in path.parent.glob(f"{prefix}*.msgpack"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not write history cache {path.name}: {str(e)}")
+
+
+async def load_cached_history(
+    source: str, symbol: str, timeframe: str
+) -> Tuple[Path, Optional[CachedHistory]]:
+    """Load today's cached history for a symbol/timeframe from disk"""
+    path = _history_cache_path(source, symbol, timeframe, datetime.utcnow().strftime("%Y%m%d"))
+    return path, await asyncio.to_thread(_read_cached_history, path)
+
+
+async def store_cached_history(path: Path, entry: CachedHistory) -> None:
+    """Persist a history entry to disk without blocking the event loop"""
+    await asyncio.to_thread(_write_cached_history, path, entry)
+
+
+async def close_session() -> None:
+    """Close the shared HTTP clients (called on application shutdown)"""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is not None and not _SHARED_SESSION.closed:
+        await _SHARED_SESSION.close()
+    _SHARED_SESSION = None
+    
+    for client in _HTTP2_CLIENTS.values():
+        await client.aclose()
+    _HTTP2_CLIENTS.clear()
+
 
 @dataclass
 class DataSourceConfig:
@@ -34,23 +301,86 @@ class DataSourceConfig:
 class DataCollector:
     """Main data collection service"""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
         self.settings = get_settings()
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.rate_limiters = {}
+        self.session = session
+        self.rate_limiters = _RATE_LIMITERS
         
     async def __aenter__(self):
         """Async context manager entry"""
-        self.session = aiohttp.ClientSession(
-            timeout=aiohttp.ClientTimeout(total=30),
-            headers={"User-Agent": "CryptoAnalyzer/1.0"}
-        )
+        if self.session is None:
+            self.session = await get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit"""
-        if self.session:
-            await self.session.close()
+        """Async context manager exit (the session outlives the collector)"""
+    
+    async def _request_json(
+        self,
+        source: str,
+        url: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[Optional[int], Mapping[str, str], Optional[Any]]:
+        """GET a JSON document through the source's rate limiter, retrying 429/5xx with backoff
+        
+        Returns (status, response headers, decoded body). The body is only set
+        for a 200; a 304 is returned as-is so callers can reuse cached data.
+        The status is None when every retry failed.
+        """
+        limiter = get_rate_limiter(source)
+        
+        for attempt in range(MAX_RETRIES + 1):
+            async with limiter:
+                status, response_headers, body = await self._send(source, url, params, headers)
+            
+            if status == 200:
+                # msgspec decodes the raw body much faster than response.json()
+                return 200, response_headers, msgspec.json.decode(body)
+            
+            if status == 304:
+                return 304, response_headers, None
+            
+            if status != 429 and status < 500:
+                logger.warning(f"{source} returned {status} for {url}")
+                return status, response_headers, None
+            
+            if attempt == MAX_RETRIES:
+                break
+            
+            backoff = min(MAX_BACKOFF_SECONDS, 2 ** attempt)
+            retry_after = response_headers.get("Retry-After")
+            delay = float(retry_after) if retry_after and retry_after.isdigit() else backoff
+            
+            logger.warning(f"{source} returned {status}, retrying in {delay}s")
+            if status == 429:
+                limiter.back_off(delay)
+            else:
+                await asyncio.sleep(delay)
+        
+        logger.error(f"{source} request failed after {MAX_RETRIES} retries: {url}")
+        return None, {}, None
+    
+    async def _send(
+        self,
+        source: str,
+        url: str,
+        params: Dict[str, Any],
+        headers: Optional[Dict[str, str]]
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Perform one GET, over HTTP/2 when the source supports it"""
+        client = get_http2_client(source)
+        if client is not None:
+            response = await client.get(url, params=params, headers=headers)
+            return response.status_code, response.headers, response.content
+        
+        async with self.session.get(url, params=params, headers=headers) as response:
+            return response.status, response.headers.copy(), await response.read()
+    
+    async def _get_json(self, source: str, url: str, params: Dict[str, Any]) -> Optional[Any]:
+        """GET a JSON document, returning None unless the source answered 200"""
+        _, _, data = await self._request_json(source, url, params)
+        return data
     
     async def get_current_price(self, symbol: str, asset_type: AssetType) -> Optional[PriceData]:
         """Get current price for an asset"""
@@ -85,33 +415,86 @@ class DataCollector:
         asset_types: Dict[str, AssetType]
     ) -> Dict[str, PriceData]:
         """Get current prices for multiple assets"""
-        tasks = []
+        crypto_symbols = []
+        other_symbols = []
         for symbol in symbols:
-            asset_type = asset_types.get(symbol, AssetType.CRYPTOCURRENCY)
-            task = self.get_current_price(symbol, asset_type)
-            tasks.append((symbol, task))
+            if asset_types.get(symbol, AssetType.CRYPTOCURRENCY) == AssetType.CRYPTOCURRENCY:
+                crypto_symbols.append(symbol)
+            else:
+                other_symbols.append(symbol)
+        
+        # One batched CoinGecko call for all cryptos, concurrent with the other assets
+        tasks = [self.get_current_price(symbol, asset_types[symbol]) for symbol in other_symbols]
+        crypto_prices, *price_results = await asyncio.gather(
+            self._get_crypto_prices(crypto_symbols), *tasks, return_exceptions=True
+        )
         
         results = {}
-        for symbol, task in tasks:
-            try:
-                price_data = await task
-                if price_data:
-                    results[symbol] = price_data
-            except Exception as e:
-                logger.error(f"Error fetching price for {symbol}: {str(e)}")
+        if isinstance(crypto_prices, Exception):
+            logger.error(f"Error fetching crypto prices for {crypto_symbols}: {str(crypto_prices)}")
+        else:
+            results.update(crypto_prices)
+        
+        for symbol, price_data in zip(other_symbols, price_results):
+            if isinstance(price_data, Exception):
+                logger.error(f"Error fetching price for {symbol}: {str(price_data)}")
+            elif price_data:
+                results[symbol] = price_data
         
         return results
     
+    async def stream_prices(
+        self, 
+        symbols: List[str], 
+        asset_types: Dict[str, AssetType]
+    ) -> AsyncIterator[Tuple[str, PriceData]]:
+        """Yield (symbol, price) pairs as soon as each fetch completes
+        
+        Same fetch plan as get_multiple_prices (one batched crypto request plus
+        one request per other asset), but consumers can render results
+        progressively instead of waiting for the slowest source.
+        """
+        crypto_symbols = [
+            symbol for symbol in symbols
+            if asset_types.get(symbol, AssetType.CRYPTOCURRENCY) == AssetType.CRYPTOCURRENCY
+        ]
+        
+        async def fetch_other(symbol: str) -> Dict[str, PriceData]:
+            price_data = await self.get_current_price(symbol, asset_types[symbol])
+            return {symbol: price_data} if price_data else {}
+        
+        tasks = [self._get_crypto_prices(crypto_symbols)] if crypto_symbols else []
+        tasks.extend(fetch_other(symbol) for symbol in symbols if symbol not in crypto_symbols)
+        
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                prices = await next_done
+            except Exception as e:
+                logger.error(f"Error streaming prices: {str(e)}")
+                continue
+            for symbol, price_data in prices.items():
+                yield symbol, price_data
+    
     async def _get_crypto_price(self, symbol: str) -> Optional[PriceData]:
         """Get cryptocurrency price from CoinGecko"""
-        try:
+        prices = await self._get_crypto_prices([symbol])
+        return prices.get(symbol)
+    
+    async def _get_crypto_prices(self, symbols: List[str]) -> Dict[str, PriceData]:
+        """Get prices for several cryptocurrencies with a single CoinGecko request"""
+        coin_ids = {}
+        for symbol in symbols:
             coin_id = ASSET_MAPPINGS["cryptocurrencies"].get(symbol.upper())
-            if not coin_id:
-                return None
-            
+            if coin_id:
+                coin_ids[symbol] = coin_id
+        
+        if not coin_ids:
+            return {}
+        
+        try:
             url = f"{DATA_SOURCES['coingecko']['base_url']}/simple/price"
             params = {
-                "ids": coin_id,
+                "ids": ",".join(sorted(set(coin_ids.values()))),
                 "vs_currencies": "usd",
                 "include_market_cap": "true",
                 "include_24hr_vol": "true",
@@ -119,32 +502,36 @@ class DataCollector:
                 "include_last_updated_at": "true"
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    coin_data = data.get(coin_id, {})
-                    
-                    return PriceData(
-                        symbol=symbol.upper(),
-                        price=Decimal(str(coin_data.get("usd", 0))),
-                        price_change_24h=Decimal(str(coin_data.get("usd_24h_change", 0))),
-                        price_change_percentage_24h=Decimal(str(coin_data.get("usd_24h_change", 0))),
-                        market_cap=Decimal(str(coin_data.get("usd_market_cap", 0))),
-                        volume_24h=Decimal(str(coin_data.get("usd_24h_vol", 0))),
-                        last_updated=datetime.utcnow()
-                    )
+            data = await self._get_json("coingecko", url, params)
+            if data is None:
+                return {}
+            
+            results = {}
+            for symbol, coin_id in coin_ids.items():
+                coin_data = data.get(coin_id, {})
+                
+                results[symbol] = PriceData(
+                    symbol=symbol.upper(),
+                    price=D(coin_data.get("usd")),
+                    price_change_24h=D(coin_data.get("usd_24h_change")),
+                    price_change_percentage_24h=D(coin_data.get("usd_24h_change")),
+                    market_cap=D(coin_data.get("usd_market_cap")),
+                    volume_24h=D(coin_data.get("usd_24h_vol")),
+                    last_updated=datetime.utcnow()
+                )
+            
+            return results
                     
         except Exception as e:
-            logger.error(f"Error fetching crypto price for {symbol}: {str(e)}")
-            return None
+            logger.error(f"Error fetching crypto prices for {symbols}: {str(e)}")
+            return {}
     
     async def _get_traditional_price(self, symbol: str) -> Optional[PriceData]:
         """Get traditional asset price from Yahoo Finance"""
         try:
             # Use yfinance for traditional assets
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            history = ticker.history(period="2d")
+            ticker = yf_ticker(symbol)
+            info, history = await asyncio.gather(_yf_info(ticker), _yf_history(ticker, period="2d"))
             
             if history.empty:
                 return None
@@ -156,11 +543,11 @@ class DataCollector:
             
             return PriceData(
                 symbol=symbol.upper(),
-                price=Decimal(str(current_price)),
-                price_change_24h=Decimal(str(price_change)),
-                price_change_percentage_24h=Decimal(str(price_change_pct)),
-                market_cap=Decimal(str(info.get("marketCap", 0))),
-                volume_24h=Decimal(str(history['Volume'].iloc[-1])),
+                price=D(current_price),
+                price_change_24h=D(price_change),
+                price_change_percentage_24h=D(price_change_pct),
+                market_cap=D(info.get("marketCap")),
+                volume_24h=D(history['Volume'].iloc[-1]),
                 last_updated=datetime.utcnow()
             )
             
@@ -189,32 +576,55 @@ class DataCollector:
                 "interval": period_config["interval"]
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    prices = data.get("prices", [])
-                    volumes = data.get("total_volumes", [])
-                    
-                    historical_points = []
-                    for i, (timestamp, price) in enumerate(prices):
-                        volume = volumes[i][1] if i < len(volumes) else 0
-                        
-                        historical_points.append(
-                            HistoricalPricePoint(
-                                timestamp=datetime.fromtimestamp(timestamp / 1000),
-                                close=Decimal(str(price)),
-                                volume=Decimal(str(volume))
-                            )
-                        )
-                    
-                    return HistoricalData(
-                        symbol=symbol.upper(),
-                        timeframe=timeframe,
-                        data=historical_points,
-                        total_points=len(historical_points),
-                        start_date=historical_points[0].timestamp if historical_points else datetime.utcnow(),
-                        end_date=historical_points[-1].timestamp if historical_points else datetime.utcnow()
+            cache_path, cached = await load_cached_history("coingecko", symbol, timeframe.value)
+            headers = {}
+            if cached is not None:
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+            
+            status, response_headers, data = await self._request_json(
+                "coingecko", url, params, headers=headers or None
+            )
+            
+            historical_points = None
+            if status == 304 and cached is not None:
+                historical_points = cached.points
+            elif data is not None:
+                prices = np.asarray(data.get("prices", []), dtype=np.float64).reshape(-1, 2)
+                volumes = np.asarray(data.get("total_volumes", []), dtype=np.float64).reshape(-1, 2)
+                
+                # Align volumes with prices; missing trailing volumes become 0
+                volume_values = np.zeros(len(prices))
+                matched = min(len(prices), len(volumes))
+                volume_values[:matched] = volumes[:matched, 1]
+                
+                timestamps = pd.to_datetime(prices[:, 0], unit="ms").to_pydatetime()
+                historical_points = [
+                    HistoricalPricePointMS(timestamp=timestamp, close=price, volume=volume)
+                    for timestamp, price, volume in zip(
+                        timestamps, prices[:, 1].tolist(), volume_values.tolist()
                     )
+                ]
+                await store_cached_history(cache_path, CachedHistory(
+                    etag=response_headers.get("ETag"),
+                    last_modified=response_headers.get("Last-Modified"),
+                    points=historical_points
+                ))
+            elif cached is not None:
+                # Serve today's cached copy when the source is unavailable
+                historical_points = cached.points
+            
+            if historical_points is not None:
+                return HistoricalData(
+                    symbol=symbol.upper(),
+                    timeframe=timeframe,
+                    data=historical_points,
+                    total_points=len(historical_points),
+                    start_date=historical_points[0].timestamp if historical_points else datetime.utcnow(),
+                    end_date=historical_points[-1].timestamp if historical_points else datetime.utcnow()
+                )
                     
         except Exception as e:
             logger.error(f"Error fetching crypto historical data for {symbol}: {str(e)}")
@@ -233,8 +643,23 @@ class DataCollector:
             end_date = datetime.now()
             start_date = end_date - timedelta(days=period_config["days"])
             
-            ticker = yf.Ticker(symbol)
-            history = ticker.history(
+            # Daily bars only change once per day, so today's disk copy is reused as-is
+            cache_path, cached = await load_cached_history("yahoo", symbol, timeframe.value)
+            if cached is not None:
+                historical_points = cached.points
+                return HistoricalData(
+                    symbol=symbol.upper(),
+                    timeframe=timeframe,
+                    data=historical_points,
+                    total_points=len(historical_points),
+                    start_date=historical_points[0].timestamp,
+                    end_date=historical_points[-1].timestamp
+                )
+            
+            ticker = yf_ticker(symbol)
+            history = await _yf_history(
+                ticker,
+                cache_key=timeframe.value,
                 start=start_date,
                 end=end_date,
                 interval="1d"  # Daily data for traditional assets
@@ -243,18 +668,25 @@ class DataCollector:
             if history.empty:
                 return None
             
-            historical_points = []
-            for index, row in history.iterrows():
-                historical_points.append(
-                    HistoricalPricePoint(
-                        timestamp=index.to_pydatetime(),
-                        open=Decimal(str(row['Open'])),
-                        high=Decimal(str(row['High'])),
-                        low=Decimal(str(row['Low'])),
-                        close=Decimal(str(row['Close'])),
-                        volume=Decimal(str(row['Volume']))
-                    )
+            historical_points = [
+                HistoricalPricePointMS(
+                    timestamp=timestamp,
+                    open=open_,
+                    high=high,
+                    low=low,
+                    close=close,
+                    volume=volume
                 )
+                for timestamp, open_, high, low, close, volume in zip(
+                    history.index.to_pydatetime(),
+                    history['Open'].to_numpy(dtype=np.float64).tolist(),
+                    history['High'].to_numpy(dtype=np.float64).tolist(),
+                    history['Low'].to_numpy(dtype=np.float64).tolist(),
+                    history['Close'].to_numpy(dtype=np.float64).tolist(),
+                    history['Volume'].to_numpy(dtype=np.float64).tolist()
+                )
+            ]
+            await store_cached_history(cache_path, CachedHistory(points=historical_points))
             
             return HistoricalData(
                 symbol=symbol.upper(),
@@ -296,29 +728,28 @@ class DataCollector:
                 "developer_data": "false"
             }
             
-            async with self.session.get(url, params=params) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    market_data = data.get("market_data", {})
-                    
-                    return MarketSummary(
-                        symbol=symbol.upper(),
-                        current_price=Decimal(str(market_data.get("current_price", {}).get("usd", 0))),
-                        market_cap=Decimal(str(market_data.get("market_cap", {}).get("usd", 0))),
-                        market_cap_rank=market_data.get("market_cap_rank"),
-                        volume_24h=Decimal(str(market_data.get("total_volume", {}).get("usd", 0))),
-                        price_change_24h=Decimal(str(market_data.get("price_change_24h", 0))),
-                        price_change_percentage_24h=Decimal(str(market_data.get("price_change_percentage_24h", 0))),
-                        price_change_7d=Decimal(str(market_data.get("price_change_percentage_7d", 0))),
-                        price_change_30d=Decimal(str(market_data.get("price_change_percentage_30d", 0))),
-                        high_24h=Decimal(str(market_data.get("high_24h", {}).get("usd", 0))),
-                        low_24h=Decimal(str(market_data.get("low_24h", {}).get("usd", 0))),
-                        ath=Decimal(str(market_data.get("ath", {}).get("usd", 0))),
-                        ath_date=datetime.fromisoformat(market_data.get("ath_date", {}).get("usd", "").replace("Z", "+00:00")) if market_data.get("ath_date", {}).get("usd") else None,
-                        atl=Decimal(str(market_data.get("atl", {}).get("usd", 0))),
-                        atl_date=datetime.fromisoformat(market_data.get("atl_date", {}).get("usd", "").replace("Z", "+00:00")) if market_data.get("atl_date", {}).get("usd") else None
-                    )
-                    
+            data = await self._get_json("coingecko", url, params)
+            if data is not None:
+                market_data = data.get("market_data", {})
+                
+                return MarketSummary(
+                    symbol=symbol.upper(),
+                    current_price=D(market_data.get("current_price", {}).get("usd")),
+                    market_cap=D(market_data.get("market_cap", {}).get("usd")),
+                    market_cap_rank=market_data.get("market_cap_rank"),
+                    volume_24h=D(market_data.get("total_volume", {}).get("usd")),
+                    price_change_24h=D(market_data.get("price_change_24h")),
+                    price_change_percentage_24h=D(market_data.get("price_change_percentage_24h")),
+                    price_change_7d=D(market_data.get("price_change_percentage_7d")),
+                    price_change_30d=D(market_data.get("price_change_percentage_30d")),
+                    high_24h=D(market_data.get("high_24h", {}).get("usd")),
+                    low_24h=D(market_data.get("low_24h", {}).get("usd")),
+                    ath=D(market_data.get("ath", {}).get("usd")),
+                    ath_date=datetime.fromisoformat(market_data.get("ath_date", {}).get("usd", "").replace("Z", "+00:00")) if market_data.get("ath_date", {}).get("usd") else None,
+                    atl=D(market_data.get("atl", {}).get("usd")),
+                    atl_date=datetime.fromisoformat(market_data.get("atl_date", {}).get("usd", "").replace("Z", "+00:00")) if market_data.get("atl_date", {}).get("usd") else None
+                )
+            
         except Exception as e:
             logger.error(f"Error fetching crypto summary for {symbol}: {str(e)}")
             return None
@@ -326,37 +757,37 @@ class DataCollector:
     async def _get_traditional_summary(self, symbol: str) -> Optional[MarketSummary]:
         """Get traditional asset summary from Yahoo Finance"""
         try:
-            ticker = yf.Ticker(symbol)
-            info = ticker.info
-            history = ticker.history(period="30d")
+            ticker = yf_ticker(symbol)
+            info, history = await asyncio.gather(_yf_info(ticker), _yf_history(ticker, period="30d"))
             
             if history.empty:
                 return None
             
-            current_price = history['Close'].iloc[-1]
+            # Pull each column into NumPy once instead of repeated label lookups
+            close = history['Close'].to_numpy()
+            current_price = close[-1]
             
             # Calculate percentage changes
             price_change_24h = 0
             price_change_7d = 0
             price_change_30d = 0
             
-            if len(history) > 1:
-                price_change_24h = ((current_price - history['Close'].iloc[-2]) / history['Close'].iloc[-2] * 100)
-            if len(history) > 7:
-                price_change_7d = ((current_price - history['Close'].iloc[-8]) / history['Close'].iloc[-8] * 100)
-            if len(history) > 1:
-                price_change_30d = ((current_price - history['Close'].iloc[0]) / history['Close'].iloc[0] * 100)
+            if len(close) > 1:
+                price_change_24h = (current_price - close[-2]) / close[-2] * 100
+                price_change_30d = (current_price - close[0]) / close[0] * 100
+            if len(close) > 7:
+                price_change_7d = (current_price - close[-8]) / close[-8] * 100
             
             return MarketSummary(
                 symbol=symbol.upper(),
-                current_price=Decimal(str(current_price)),
-                market_cap=Decimal(str(info.get("marketCap", 0))),
-                volume_24h=Decimal(str(history['Volume'].iloc[-1])),
-                price_change_percentage_24h=Decimal(str(price_change_24h)),
-                price_change_7d=Decimal(str(price_change_7d)),
-                price_change_30d=Decimal(str(price_change_30d)),
-                high_24h=Decimal(str(history['High'].iloc[-1])),
-                low_24h=Decimal(str(history['Low'].iloc[-1]))
+                current_price=D(current_price),
+                market_cap=D(info.get("marketCap")),
+                volume_24h=D(history['Volume'].to_numpy()[-1]),
+                price_change_percentage_24h=D(price_change_24h),
+                price_change_7d=D(price_change_7d),
+                price_change_30d=D(price_change_30d),
+                high_24h=D(history['High'].to_numpy()[-1]),
+                low_24h=D(history['Low'].to_numpy()[-1])
             )
             
         except Exception as e:
@@ -371,7 +802,7 @@ async def fetch_multiple_assets_data(
     data_type: str = "price"
 ) -> Dict[str, Any]:
     """Fetch data for multiple assets concurrently"""
-    async with DataCollector() as collector:
+    async with DataCollector(session=await get_session()) as collector:
         if data_type == "price":
             return await collector.get_multiple_prices(symbols, asset_types)
         # Add other data types as needed
@@ -379,22 +810,32 @@ async def fetch_multiple_assets_data(
     return {}
 
 
+def _classify_traditional(symbol: str) -> AssetType:
+    if symbol.startswith("^"):
+        return AssetType.INDEX
+    elif symbol in ["GLD", "SLV"]:
+        return AssetType.COMMODITY
+    else:
+        return AssetType.ETF
+
+
+# Known symbols resolved once at import so lookups are a single dict hit
+_SYMBOL_TO_TYPE: Dict[str, AssetType] = {
+    **{symbol: _classify_traditional(symbol) for symbol in ASSET_MAPPINGS["traditional"]},
+    **{symbol: AssetType.CRYPTOCURRENCY for symbol in ASSET_MAPPINGS["cryptocurrencies"]},
+}
+
+
 def get_asset_type_from_symbol(symbol: str) -> AssetType:
     """Determine asset type from symbol"""
     symbol = symbol.upper()
     
-    if symbol in ASSET_MAPPINGS["cryptocurrencies"]:
-        return AssetType.CRYPTOCURRENCY
-    elif symbol in ASSET_MAPPINGS["traditional"]:
-        if symbol.startswith("^"):
-            return AssetType.INDEX
-        elif symbol in ["GLD", "SLV"]:
-            return AssetType.COMMODITY
-        else:
-            return AssetType.ETF
+    asset_type = _SYMBOL_TO_TYPE.get(symbol)
+    if asset_type is not None:
+        return asset_type
+    
+    # Default guess based on symbol patterns
+    if len(symbol) <= 4 and symbol.isalpha():
+        return AssetType.STOCK
     else:
-        # Default guess based on symbol patterns
-        if len(symbol) <= 4 and symbol.isalpha():
-            return AssetType.STOCK
-        else:
-            return AssetType.CRYPTOCURRENCY
\ No newline at end of file
+        return AssetType.CRYPTOCURRENCY
\ No newline at end of file
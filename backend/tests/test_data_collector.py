@@ -0,0 +1,41 @@
+"""
+Data collector tests - shared HTTP clients and rate limiters
+"""
+
+import asyncio
+import os
+import sys
+
+# Backend modules are imported flat (models.asset, services...), as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.data_collector import close_session, get_http2_client, get_rate_limiter, get_session
+
+
+async def _use_shared_state():
+    """Take the shared session and saturate the CoinGecko limiter's semaphore"""
+    session = await get_session()
+    limiter = get_rate_limiter("coingecko")
+
+    async def hold():
+        async with limiter:
+            await asyncio.sleep(0.01)
+
+    # More tasks than max_concurrency, so some of them wait on the semaphore
+    await asyncio.gather(*(hold() for _ in range(8)))
+    await close_session()
+    return session, limiter
+
+
+def test_shared_state_survives_new_event_loops():
+    """A second asyncio.run() gets fresh loop-bound clients and limiters"""
+    first_session, first_limiter = asyncio.run(_use_shared_state())
+    second_session, second_limiter = asyncio.run(_use_shared_state())
+
+    assert second_session is not first_session
+    assert second_limiter is not first_limiter
+
+
+def test_http2_is_opt_in():
+    """Without HTTP2_ENABLED every source goes through the aiohttp session"""
+    assert get_http2_client("coingecko") is None
@@ -0,0 +1,44 @@
+"""
+API schema tests - the OpenAPI document must build with the msgspec-backed models
+"""
+
+import os
+import sys
+
+# Backend modules are imported flat (models.asset, api.routes...), as main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient
+
+from main import app
+from models.asset import HistoricalData
+
+client = TestClient(app)
+
+
+def test_openapi_schema():
+    """/openapi.json is served and documents the asset list items"""
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+
+    schemas = response.json()["components"]["schemas"]
+    items = schemas["PaginatedAssetResponse"]["properties"]["data"]["items"]
+    assert items["title"] == "AssetListItemSchema"
+    assert items["properties"]["current_price"]["anyOf"][0]["type"] == "number"
+
+
+def test_historical_data_schema():
+    """HistoricalData documents its struct price points with float prices"""
+    schema = HistoricalData.model_json_schema(mode="serialization")
+    points = schema["properties"]["data"]["items"]
+    assert points["properties"]["close"]["type"] == "number"
+
+
+def test_list_assets():
+    """The list route encodes its struct items directly"""
+    response = client.get("/api/v1/assets/", params={"per_page": 5})
+    assert response.status_code == 200
+
+    body = response.json()
+    assert len(body["data"]) == 5
+    assert {"symbol", "name", "asset_type"} <= set(body["data"][0])
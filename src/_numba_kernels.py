@@ -0,0 +1,134 @@
+"""
+Crypto Market Analysis - Compiled kernels
+Description: Per-asset reductions used by the analyzer
+
+Numba is optional: when it is not installed NUMBA_AVAILABLE is False and the
+analyzer keeps its pandas implementation. The kernels are compiled without
+parallel=True: Streamlit runs scripts on worker threads, where Numba's default
+threading layer is not safe, and there are only a handful of asset columns.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in so the kernels can still be defined without Numba"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def mean_std_columns(returns):
+    """
+    Mean and sample standard deviation of every column in one pass (Welford)
+
+    Args:
+        returns (np.ndarray): (periods x assets) returns matrix
+
+    Returns:
+        np.ndarray: (2 x assets) array with means in row 0 and stds in row 1
+    """
+    n_rows, n_cols = returns.shape
+    out = np.full((2, n_cols), np.nan)
+
+    for j in range(n_cols):
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n_rows):
+            x = returns[i, j]
+            if np.isnan(x):
+                continue
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+        if count > 0:
+            out[0, j] = mean
+        if count > 1:
+            out[1, j] = np.sqrt(m2 / (count - 1))
+
+    return out
+
+
+@njit(cache=True)
+def max_drawdown_columns(prices):
+    """
+    Maximum drawdown of every column in a single scan tracking the running peak
+
+    Args:
+        prices (np.ndarray): (periods x assets) price matrix
+
+    Returns:
+        np.ndarray: Max drawdown per asset (<= 0, NaN for empty columns)
+    """
+    n_rows, n_cols = prices.shape
+    out = np.full(n_cols, np.nan)
+
+    for j in range(n_cols):
+        peak = np.nan
+        worst = np.nan
+        for i in range(n_rows):
+            x = prices[i, j]
+            if np.isnan(x):
+                continue
+            if np.isnan(peak) or x > peak:
+                peak = x
+            drawdown = (x - peak) / peak
+            if np.isnan(worst) or drawdown < worst:
+                worst = drawdown
+        out[j] = worst
+
+    return out
+
+
+@njit(cache=True)
+def rolling_std_columns(returns, window):
+    """
+    Rolling sample standard deviation of every column, updating the window
+    statistics by adding the entering and removing the exiting observation
+
+    Args:
+        returns (np.ndarray): (periods x assets) returns matrix
+        window (int): Rolling window size
+
+    Returns:
+        np.ndarray: Same shape as returns, NaN until a full window is available
+    """
+    n_rows, n_cols = returns.shape
+    out = np.full((n_rows, n_cols), np.nan)
+
+    for j in range(n_cols):
+        nobs = 0
+        mean = 0.0
+        m2 = 0.0
+        for i in range(n_rows):
+            x = returns[i, j]
+            if not np.isnan(x):
+                nobs += 1
+                delta = x - mean
+                mean += delta / nobs
+                m2 += delta * (x - mean)
+
+            if i >= window:
+                old = returns[i - window, j]
+                if not np.isnan(old):
+                    nobs -= 1
+                    if nobs > 0:
+                        delta = old - mean
+                        mean -= delta / nobs
+                        m2 -= delta * (old - mean)
+                    else:
+                        mean = 0.0
+                        m2 = 0.0
+
+            if nobs == window and window > 1:
+                out[i, j] = np.sqrt(max(m2, 0.0) / (window - 1))
+
+    return out
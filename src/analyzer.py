@@ -8,22 +8,43 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 import os
+import re
+
+from _numba_kernels import NUMBA_AVAILABLE, max_drawdown_columns, mean_std_columns, rolling_std_columns
+
+CRYPTO_PATTERN = re.compile(r'bitcoin|ethereum|cardano|solana', re.IGNORECASE)
 
 class MarketAnalyzer:
     """
     Analyzes market data and calculates key metrics
     """
     
-    def __init__(self, data_df):
+    def __init__(self, data_df, audit=False):
         """
         Initialize analyzer with market data
         
         Args:
             data_df (pd.DataFrame): DataFrame with market data
+            audit (bool): Keep float64 precision instead of the float32 used for
+                display-grade metrics
         """
-        self.data = data_df.copy()
+        # float32 halves the memory traffic of every rolling/cumulative/GEMM pass.
+        # The data is only read, so no defensive copy is made when it already has that dtype
+        dtype = np.float64 if audit else np.float32
+        self.data = data_df if (data_df.dtypes == dtype).all() else data_df.astype(dtype)
         self.returns = self.calculate_returns()
-        self.results = {}
+        
+        # Split crypto and traditional assets once
+        self.crypto_cols = [col for col in self.data.columns if CRYPTO_PATTERN.search(col)]
+        crypto_set = set(self.crypto_cols)
+        self.traditional_cols = [col for col in self.data.columns if col not in crypto_set]
+        
+        # Equal-weighted daily return of each group, shared by the comparison metrics
+        self._group_returns = {
+            'crypto': self.returns[self.crypto_cols].to_numpy().mean(axis=1),
+            'traditional': self.returns[self.traditional_cols].to_numpy().mean(axis=1)
+        } if self.crypto_cols and self.traditional_cols else {}
+        self.results = {}  # memoized outputs of the calculate_* methods
     
     def calculate_returns(self):
         """
@@ -45,7 +66,15 @@ class MarketAnalyzer:
         Returns:
             pd.DataFrame: Volatility data
         """
-        volatility = self.returns.rolling(window=window).std() * np.sqrt(365)
+        if NUMBA_AVAILABLE:
+            rolling_std = pd.DataFrame(
+                rolling_std_columns(self.returns.to_numpy(), window),
+                index=self.returns.index, columns=self.returns.columns
+            )
+        else:
+            rolling_std = self.returns.rolling(window=window).std()
+        
+        volatility = rolling_std * np.sqrt(365)
         return volatility
     
     def calculate_correlations(self):
@@ -55,7 +84,18 @@ class MarketAnalyzer:
         Returns:
             pd.DataFrame: Correlation matrix
         """
-        correlation_matrix = self.returns.corr()
+        if 'correlations' in self.results:
+            return self.results['correlations']
+        
+        # Pearson correlation as one matrix product on standardized returns
+        values = self.returns.to_numpy()
+        centered = values - values.mean(axis=0)
+        standardized = centered / centered.std(axis=0, ddof=1)
+        matrix = (standardized.T @ standardized) / (len(standardized) - 1)
+        
+        columns = self.returns.columns
+        correlation_matrix = pd.DataFrame(matrix, index=columns, columns=columns)
+        self.results['correlations'] = correlation_matrix
         return correlation_matrix
     
     def calculate_sharpe_ratio(self, risk_free_rate=0.02):
@@ -68,8 +108,9 @@ class MarketAnalyzer:
         Returns:
             pd.Series: Sharpe ratios
         """
-        annual_returns = self.returns.mean() * 365
-        annual_volatility = self.returns.std() * np.sqrt(365)
+        mean_returns, std_returns = self._return_moments()
+        annual_returns = mean_returns * 365
+        annual_volatility = std_returns * np.sqrt(365)
         
         sharpe_ratios = (annual_returns - risk_free_rate) / annual_volatility
         return sharpe_ratios
@@ -81,46 +122,79 @@ class MarketAnalyzer:
         Returns:
             pd.DataFrame: Performance metrics
         """
-        metrics = {}
+        if 'performance' in self.results:
+            return self.results['performance']
+        
+        # Whole-frame reductions instead of one pandas call per column
+        total_returns = (self.data.iloc[-1] / self.data.iloc[0]) - 1
+        mean_returns, std_returns = self._return_moments()
+        annual_returns = mean_returns * 365
+        annual_volatility = std_returns * np.sqrt(365)
+        
+        # Risk metrics
+        max_drawdown = self._max_drawdowns()
+        returns_array = annual_returns.to_numpy()
+        volatility_array = annual_volatility.to_numpy()
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sharpe_ratio = pd.Series(
+                np.where(volatility_array > 0, (returns_array - 0.02) / volatility_array, 0.0),
+                index=annual_returns.index
+            )
+        
+        performance = pd.DataFrame({
+            'Total Return (%)': total_returns * 100,
+            'Annual Return (%)': annual_returns * 100,
+            'Annual Volatility (%)': annual_volatility * 100,
+            'Sharpe Ratio': sharpe_ratio,
+            'Max Drawdown (%)': max_drawdown * 100,
+            'Current Price': self.data.iloc[-1]
+        })
+        self.results['performance'] = performance
+        return performance
+    
+    def _return_moments(self):
+        """
+        Mean and standard deviation of the daily returns of every asset
         
-        for column in self.data.columns:
-            asset_returns = self.returns[column]
-            asset_prices = self.data[column]
-            
-            # Basic metrics
-            total_return = (asset_prices.iloc[-1] / asset_prices.iloc[0]) - 1
-            annual_return = asset_returns.mean() * 365
-            annual_volatility = asset_returns.std() * np.sqrt(365)
-            
-            # Risk metrics
-            max_drawdown = self.calculate_max_drawdown(asset_prices)
-            sharpe_ratio = (annual_return - 0.02) / annual_volatility if annual_volatility > 0 else 0
-            
-            # Store metrics
-            metrics[column] = {
-                'Total Return (%)': total_return * 100,
-                'Annual Return (%)': annual_return * 100,
-                'Annual Volatility (%)': annual_volatility * 100,
-                'Sharpe Ratio': sharpe_ratio,
-                'Max Drawdown (%)': max_drawdown * 100,
-                'Current Price': asset_prices.iloc[-1]
-            }
-        
-        return pd.DataFrame(metrics).T
+        Returns:
+            tuple: (pd.Series, pd.Series) of means and stds
+        """
+        if not NUMBA_AVAILABLE:
+            return self.returns.mean(), self.returns.std()
+        
+        moments = mean_std_columns(self.returns.to_numpy())
+        columns = self.returns.columns
+        return pd.Series(moments[0], index=columns), pd.Series(moments[1], index=columns)
+    
+    def _max_drawdowns(self):
+        """
+        Maximum drawdown of every asset
+        
+        Returns:
+            pd.Series: Max drawdowns
+        """
+        if not NUMBA_AVAILABLE:
+            running_max = self.data.cummax()
+            return ((self.data - running_max) / running_max).min()
+        
+        return pd.Series(max_drawdown_columns(self.data.to_numpy()), index=self.data.columns)
     
     def calculate_max_drawdown(self, price_series):
         """
         Calculate maximum drawdown
         
         Args:
-            price_series (pd.Series): Price series
+            price_series (str or pd.Series): Column name or price series
             
         Returns:
             float: Maximum drawdown
         """
-        cumulative = (1 + price_series.pct_change()).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
+        if isinstance(price_series, str):
+            price_series = self.data[price_series]
+        
+        # Drawdown is scale-free, so the raw prices stand in for the compounded returns
+        running_max = price_series.cummax()
+        drawdown = (price_series - running_max) / running_max
         return drawdown.min()
     
     def crypto_vs_traditional_analysis(self):
@@ -130,35 +204,26 @@ class MarketAnalyzer:
         Returns:
             dict: Analysis results
         """
-        # Separate crypto and traditional assets
-        crypto_cols = [col for col in self.data.columns if any(crypto in col.lower() 
-                      for crypto in ['bitcoin', 'ethereum', 'cardano', 'solana'])]
-        traditional_cols = [col for col in self.data.columns if col not in crypto_cols]
+        if 'crypto_vs_traditional' in self.results:
+            return self.results['crypto_vs_traditional']
+        
+        crypto_cols = self.crypto_cols
+        traditional_cols = self.traditional_cols
         
         if not crypto_cols or not traditional_cols:
-            return {"error": "Need both crypto and traditional assets for comparison"}
+            self.results['crypto_vs_traditional'] = {"error": "Need both crypto and traditional assets for comparison"}
+            return self.results['crypto_vs_traditional']
         
         # Calculate average performance
-        crypto_returns = self.returns[crypto_cols].mean(axis=1)
-        traditional_returns = self.returns[traditional_cols].mean(axis=1)
+        crypto_returns = self._group_returns['crypto']
+        traditional_returns = self._group_returns['traditional']
         
         # Performance comparison
-        crypto_performance = {
-            'avg_daily_return': crypto_returns.mean() * 100,
-            'avg_annual_return': crypto_returns.mean() * 365 * 100,
-            'volatility': crypto_returns.std() * np.sqrt(365) * 100,
-            'sharpe_ratio': (crypto_returns.mean() * 365 - 0.02) / (crypto_returns.std() * np.sqrt(365))
-        }
-        
-        traditional_performance = {
-            'avg_daily_return': traditional_returns.mean() * 100,
-            'avg_annual_return': traditional_returns.mean() * 365 * 100,
-            'volatility': traditional_returns.std() * np.sqrt(365) * 100,
-            'sharpe_ratio': (traditional_returns.mean() * 365 - 0.02) / (traditional_returns.std() * np.sqrt(365))
-        }
+        crypto_performance = self._group_performance(crypto_returns)
+        traditional_performance = self._group_performance(traditional_returns)
         
         # Correlation analysis
-        crypto_traditional_corr = crypto_returns.corr(traditional_returns)
+        crypto_traditional_corr = np.corrcoef(crypto_returns, traditional_returns)[0, 1]
         
         analysis = {
             'crypto_performance': crypto_performance,
@@ -168,8 +233,29 @@ class MarketAnalyzer:
             'traditional_assets': traditional_cols
         }
         
+        self.results['crypto_vs_traditional'] = analysis
         return analysis
     
+    def _group_performance(self, group_returns):
+        """
+        Performance summary of a group's average daily returns
+        
+        Args:
+            group_returns (np.ndarray): Daily returns of the group
+            
+        Returns:
+            dict: Daily/annual return, volatility and Sharpe ratio
+        """
+        mean = group_returns.mean()
+        annual_volatility = group_returns.std(ddof=1) * np.sqrt(365)
+        
+        return {
+            'avg_daily_return': mean * 100,
+            'avg_annual_return': mean * 365 * 100,
+            'volatility': annual_volatility * 100,
+            'sharpe_ratio': (mean * 365 - 0.02) / annual_volatility
+        }
+    
     def generate_insights(self):
         """
         Generate key insights from the analysis
@@ -182,28 +268,33 @@ class MarketAnalyzer:
         # Performance metrics
         performance = self.calculate_performance_metrics()
         
+        # Work on plain arrays so each lookup is a NumPy reduction, not a .loc call
+        assets = performance.index.to_numpy()
+        total_returns = performance['Total Return (%)'].to_numpy()
+        volatilities = performance['Annual Volatility (%)'].to_numpy()
+        sharpe_ratios = performance['Sharpe Ratio'].to_numpy()
+        
         # Best performer
-        best_performer = performance['Total Return (%)'].idxmax()
-        best_return = performance.loc[best_performer, 'Total Return (%)']
-        insights.append(f"🏆 Best performer: {best_performer} with {best_return:.1f}% total return")
+        best = np.nanargmax(total_returns)
+        insights.append(f"🏆 Best performer: {assets[best]} with {total_returns[best]:.1f}% total return")
         
         # Most volatile
-        most_volatile = performance['Annual Volatility (%)'].idxmax()
-        volatility = performance.loc[most_volatile, 'Annual Volatility (%)']
-        insights.append(f"📊 Most volatile: {most_volatile} with {volatility:.1f}% annual volatility")
+        most_volatile = np.nanargmax(volatilities)
+        insights.append(f"📊 Most volatile: {assets[most_volatile]} with {volatilities[most_volatile]:.1f}% annual volatility")
         
         # Best risk-adjusted return
-        best_sharpe = performance['Sharpe Ratio'].idxmax()
-        sharpe = performance.loc[best_sharpe, 'Sharpe Ratio']
-        insights.append(f"⚖️ Best risk-adjusted return: {best_sharpe} with Sharpe ratio of {sharpe:.2f}")
+        best_sharpe = np.nanargmax(sharpe_ratios)
+        insights.append(f"⚖️ Best risk-adjusted return: {assets[best_sharpe]} with Sharpe ratio of {sharpe_ratios[best_sharpe]:.2f}")
         
         # Correlation insights
         correlations = self.calculate_correlations()
         
-        # Find highest correlation (excluding self-correlation)
-        corr_matrix = correlations.where(np.triu(np.ones(correlations.shape), k=1).astype(bool))
-        max_corr = corr_matrix.max().max()
-        max_corr_pair = corr_matrix.stack().idxmax()
+        # Find highest correlation (excluding self-correlation) on the upper triangle
+        rows, cols = np.triu_indices(len(correlations), k=1)
+        pairs = correlations.to_numpy()[rows, cols]
+        best = np.nanargmax(pairs)
+        max_corr = pairs[best]
+        max_corr_pair = (correlations.index[rows[best]], correlations.columns[cols[best]])
         
         insights.append(f"🔗 Highest correlation: {max_corr_pair[0]} and {max_corr_pair[1]} ({max_corr:.2f})")
         
@@ -4,13 +4,37 @@ Author: [Tu nombre]
 Description: Collects cryptocurrency and traditional market data from APIs
 """
 
+import asyncio
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-import yfinance as yf
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import os
+import threading
 import time
 
+class RateLimiter:
+    """
+    Thread-safe limiter spacing calls at most `rate` per second
+    """
+    
+    def __init__(self, rate=1.0):
+        self.interval = 1.0 / rate
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the caller may issue its request"""
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        
+        if slot > now:
+            time.sleep(slot - now)
+
 class CryptoMarketCollector:
     """
     Collects data from cryptocurrency and traditional markets
@@ -19,6 +43,16 @@ class CryptoMarketCollector:
     def __init__(self):
         self.coingecko_base_url = "https://api.coingecko.com/api/v3"
         self.data_folder = "data"
+        self.cache_folder = os.path.join(self.data_folder, ".cache")
+        
+        # Reuse one HTTP session so repeated requests keep the connection alive
+        self.session = requests.Session()
+        retries = Retry(total=3, backoff_factor=1, status_forcelist=[429, 500, 502, 503, 504],
+                        allowed_methods=['GET'])
+        self.session.mount('https://', HTTPAdapter(max_retries=retries))
+        
+        # CoinGecko's free tier allows roughly one request per second
+        self.coingecko_limiter = RateLimiter(rate=1.0)
         
         # Create data folder if it doesn't exist
         if not os.path.exists(self.data_folder):
@@ -35,45 +69,63 @@ class CryptoMarketCollector:
         Returns:
             pd.DataFrame: DataFrame with crypto prices
         """
-        crypto_data = {}
-        
-        for crypto_id in crypto_ids:
-            try:
-                url = f"{self.coingecko_base_url}/coins/{crypto_id}/market_chart"
-                params = {
-                    'vs_currency': 'usd',
-                    'days': days,
-                    'interval': 'daily'
-                }
-                
-                response = requests.get(url, params=params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Convert to DataFrame
-                prices = data['prices']
-                df = pd.DataFrame(prices, columns=['timestamp', f'{crypto_id}_price'])
-                df['date'] = pd.to_datetime(df['timestamp'], unit='ms')
-                df = df.drop('timestamp', axis=1)
-                df = df.set_index('date')
-                
-                crypto_data[crypto_id] = df
-                
-                print(f"✅ Successfully collected {crypto_id} data")
-                time.sleep(1)  # Be nice to the API
-                
-            except Exception as e:
-                print(f"❌ Error collecting {crypto_id}: {str(e)}")
-                continue
+        # Requests overlap while the shared limiter keeps the API rate in check
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = executor.map(lambda crypto_id: self._fetch_one_crypto(crypto_id, days), crypto_ids)
+            crypto_data = {f'{crypto_id}_price': prices
+                           for crypto_id, prices in zip(crypto_ids, results) if prices is not None}
         
-        # Combine all crypto data
+        # Combine all crypto data in a single construction
         if crypto_data:
-            combined_df = pd.concat(crypto_data.values(), axis=1)
+            combined_df = pd.DataFrame(crypto_data)
+            combined_df.index.name = 'date'
             return combined_df
         else:
             return pd.DataFrame()
     
+    def _fetch_one_crypto(self, crypto_id, days):
+        """
+        Get the price history of a single cryptocurrency
+        
+        Args:
+            crypto_id (str): Cryptocurrency ID
+            days (int): Number of days of historical data
+            
+        Returns:
+            pd.Series: Prices indexed by date, or None on failure
+        """
+        cached = self._read_cache('coingecko', f'{crypto_id}_{days}')
+        if cached is not None:
+            print(f"✅ Loaded {crypto_id} data from today's cache")
+            return cached
+        
+        try:
+            url = f"{self.coingecko_base_url}/coins/{crypto_id}/market_chart"
+            params = {
+                'vs_currency': 'usd',
+                'days': days,
+                'interval': 'daily'
+            }
+            
+            self.coingecko_limiter.wait()  # Be nice to the API
+            response = self.session.get(url, params=params)
+            response.raise_for_status()
+            
+            data = response.json()
+            
+            # Keep the raw columns; the frame is built once by the caller
+            timestamps, prices = zip(*data['prices'])
+            
+            series = pd.Series(prices, index=pd.to_datetime(timestamps, unit='ms'))
+            self._write_cache('coingecko', f'{crypto_id}_{days}', series)
+            
+            print(f"✅ Successfully collected {crypto_id} data")
+            return series
+            
+        except Exception as e:
+            print(f"❌ Error collecting {crypto_id}: {str(e)}")
+            return None
+    
     def get_traditional_market_data(self, symbols, period="1y"):
         """
         Get traditional market data from Yahoo Finance
@@ -85,34 +137,96 @@ class CryptoMarketCollector:
         Returns:
             pd.DataFrame: DataFrame with traditional market prices
         """
-        traditional_data = {}
+        import yfinance as yf  # imported on first use, it is slow to load
         
+        closes = {}
+        missing = []
         for symbol in symbols:
+            cached = self._read_cache('yahoo', f'{symbol}_{period}')
+            if cached is not None:
+                closes[symbol] = cached
+                print(f"✅ Loaded {symbol} data from today's cache")
+            else:
+                missing.append(symbol)
+        
+        if missing:
             try:
-                ticker = yf.Ticker(symbol)
-                hist = ticker.history(period=period)
-                
-                # Get closing prices
-                df = pd.DataFrame()
-                df[f'{symbol}_price'] = hist['Close']
-                df.index = pd.to_datetime(df.index).date
-                df.index = pd.to_datetime(df.index)
-                
-                traditional_data[symbol] = df
+                # One threaded download for every symbol instead of a history() call each
+                hist = yf.download(missing, period=period, group_by='column',
+                                   auto_adjust=True, progress=False)
+            except Exception as e:
+                print(f"❌ Error collecting {', '.join(missing)}: {str(e)}")
+                hist = pd.DataFrame()
+            
+            # Get closing prices
+            downloaded = hist['Close'] if not hist.empty else pd.DataFrame()
+            if isinstance(downloaded, pd.Series):
+                downloaded = downloaded.to_frame(missing[0])
+            downloaded = downloaded.reindex(columns=missing)
+            
+            for symbol in missing:
+                series = downloaded[symbol].dropna()
+                if series.empty:
+                    print(f"❌ Error collecting {symbol}: no data returned")
+                    continue
                 
+                series.index = pd.to_datetime(pd.to_datetime(series.index).date)
+                self._write_cache('yahoo', f'{symbol}_{period}', series)
+                closes[symbol] = series
                 print(f"✅ Successfully collected {symbol} data")
-                
-            except Exception as e:
-                print(f"❌ Error collecting {symbol}: {str(e)}")
-                continue
         
-        # Combine all traditional market data
-        if traditional_data:
-            combined_df = pd.concat(traditional_data.values(), axis=1)
-            return combined_df
+        # Combine all traditional market data in a single construction
+        if closes:
+            return pd.DataFrame({f'{symbol}_price': closes[symbol] for symbol in symbols if symbol in closes})
         else:
             return pd.DataFrame()
     
+    def _cache_path(self, source, key):
+        """Path of today's cached series for (source, key)"""
+        return os.path.join(self.cache_folder, f"{source}_{key}_{datetime.now().strftime('%Y%m%d')}.parquet")
+    
+    def _read_cache(self, source, key):
+        """
+        Read a series cached earlier today
+        
+        Args:
+            source (str): Data source name
+            key (str): Symbol and request parameters
+            
+        Returns:
+            pd.Series: Cached prices, or None on a miss
+        """
+        path = self._cache_path(source, key)
+        if not os.path.exists(path):
+            return None
+        
+        try:
+            return pd.read_parquet(path).iloc[:, 0]
+        except Exception:
+            return None
+    
+    def _write_cache(self, source, key, series):
+        """
+        Cache a series for the rest of the day and drop older days of the same key
+        
+        Args:
+            source (str): Data source name
+            key (str): Symbol and request parameters
+            series (pd.Series): Prices to cache
+        """
+        path = self._cache_path(source, key)
+        prefix = f"{source}_{key}_"
+        
+        try:
+            os.makedirs(self.cache_folder, exist_ok=True)
+            series.to_frame('price').to_parquet(path, compression='zstd')
+            
+            for name in os.listdir(self.cache_folder):
+                if name.startswith(prefix) and os.path.join(self.cache_folder, name) != path:
+                    os.remove(os.path.join(self.cache_folder, name))
+        except OSError as e:
+            print(f"⚠️ Could not cache {key}: {str(e)}")
+    
     def get_combined_data(self, crypto_ids=['bitcoin', 'ethereum'], 
                          traditional_symbols=['SPY', 'QQQ', 'GLD'], 
                          days=365):
@@ -128,24 +242,61 @@ class CryptoMarketCollector:
             pd.DataFrame: Combined dataset
         """
         print("🚀 Starting data collection...")
+        print("\n📈 Collecting cryptocurrency and 📊 traditional market data...")
+        
+        # Both sources are network bound, so they are fetched side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            crypto_future = executor.submit(self.get_crypto_data, crypto_ids, days)
+            traditional_future = executor.submit(self.get_traditional_market_data, traditional_symbols, "1y")
+            crypto_df = crypto_future.result()
+            traditional_df = traditional_future.result()
+        
+        return self._combine_and_save(crypto_df, traditional_df)
+    
+    async def get_combined_data_async(self, crypto_ids=['bitcoin', 'ethereum'],
+                                      traditional_symbols=['SPY', 'QQQ', 'GLD'],
+                                      days=365):
+        """
+        Async variant of get_combined_data for callers that run an event loop
+        
+        Args:
+            crypto_ids (list): Cryptocurrency IDs
+            traditional_symbols (list): Traditional market symbols
+            days (int): Days of historical data
+            
+        Returns:
+            pd.DataFrame: Combined dataset
+        """
+        print("🚀 Starting data collection...")
+        print("\n📈 Collecting cryptocurrency and 📊 traditional market data...")
         
-        # Get crypto data
-        print("\n📈 Collecting cryptocurrency data...")
-        crypto_df = self.get_crypto_data(crypto_ids, days)
+        # The collectors use blocking clients, so each runs in a worker thread
+        crypto_df, traditional_df = await asyncio.gather(
+            asyncio.to_thread(self.get_crypto_data, crypto_ids, days),
+            asyncio.to_thread(self.get_traditional_market_data, traditional_symbols, "1y")
+        )
         
-        # Get traditional market data
-        print("\n📊 Collecting traditional market data...")
-        traditional_df = self.get_traditional_market_data(traditional_symbols, "1y")
+        return self._combine_and_save(crypto_df, traditional_df)
+    
+    def _combine_and_save(self, crypto_df, traditional_df):
+        """
+        Align crypto and traditional data on common dates and save the result
         
-        # Combine datasets
+        Args:
+            crypto_df (pd.DataFrame): Crypto prices
+            traditional_df (pd.DataFrame): Traditional market prices
+            
+        Returns:
+            pd.DataFrame: Combined dataset, empty if either side is missing
+        """
         if not crypto_df.empty and not traditional_df.empty:
             # Align dates
             combined_df = pd.concat([crypto_df, traditional_df], axis=1)
             combined_df = combined_df.dropna()
             
-            # Save to CSV
-            filename = f"{self.data_folder}/market_data_{datetime.now().strftime('%Y%m%d')}.csv"
-            combined_df.to_csv(filename)
+            # Save to Parquet (typed and columnar, much faster to reload than CSV)
+            filename = f"{self.data_folder}/market_data_{datetime.now().strftime('%Y%m%d')}.parquet"
+            combined_df.to_parquet(filename, compression='zstd')
             
             print(f"\n✅ Data saved to {filename}")
             print(f"📊 Dataset shape: {combined_df.shape}")
@@ -156,6 +307,28 @@ class CryptoMarketCollector:
             print("❌ Failed to collect data")
             return pd.DataFrame()
 
+    def load_saved_data(self, filename=None):
+        """
+        Load a dataset previously saved by get_combined_data
+        
+        Args:
+            filename (str): File to load (None for the most recent market_data_* file)
+            
+        Returns:
+            pd.DataFrame: Saved dataset, empty if nothing was found
+        """
+        if filename is None:
+            saved = [os.path.join(self.data_folder, name) for name in os.listdir(self.data_folder)
+                     if name.startswith('market_data_') and name.endswith(('.parquet', '.csv'))]
+            if not saved:
+                return pd.DataFrame()
+            filename = max(saved, key=os.path.getmtime)
+        
+        # Older runs saved CSV files
+        if filename.endswith('.csv'):
+            return pd.read_csv(filename, index_col=0, parse_dates=True)
+        return pd.read_parquet(filename)
+
 # Example usage
 if __name__ == "__main__":
     collector = CryptoMarketCollector()
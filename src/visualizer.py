@@ -4,13 +4,8 @@ Author: [Tu nombre]
 Description: Creates visualizations for cryptocurrency and traditional market analysis
 """
 
-import matplotlib.pyplot as plt
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
 import pandas as pd
 import numpy as np
-import seaborn as sns
 from datetime import datetime
 import os
 
@@ -27,13 +22,23 @@ class MarketVisualizer:
             data_df (pd.DataFrame): DataFrame with market data
             analyzer (MarketAnalyzer): Optional analyzer instance
         """
-        self.data = data_df.copy()
+        self.data = data_df  # only read, never modified, so no copy is needed
         self.analyzer = analyzer
         
+        # Display labels for every column ('bitcoin_price' -> 'BITCOIN'), built once
+        self._clean_names = dict(zip(
+            self.data.columns,
+            self.data.columns.str.replace('_price', '', regex=False).str.upper()
+        ))
+        # Reuse the analyzer's returns rather than recomputing pct_change per plot
+        self.returns = analyzer.returns if analyzer is not None else self.data.pct_change().dropna()
+        
         # Create results folder if it doesn't exist
         os.makedirs("results", exist_ok=True)
         
-        # Set style
+        # Set style (plotting libraries are imported lazily to keep startup fast)
+        import matplotlib.pyplot as plt
+        import seaborn as sns
         plt.style.use('seaborn-v0_8')
         sns.set_palette("husl")
     
@@ -48,6 +53,8 @@ class MarketVisualizer:
         Returns:
             plotly.graph_objects.Figure: Interactive plot
         """
+        import plotly.graph_objects as go
+        
         if assets is None:
             assets = self.data.columns.tolist()
         
@@ -67,7 +74,7 @@ class MarketVisualizer:
                 fig.add_trace(go.Scatter(
                     x=prices.index,
                     y=prices,
-                    name=asset.replace('_price', '').upper(),
+                    name=self._clean_names[asset],
                     line=dict(width=2),
                     hovertemplate='<b>%{fullData.name}</b><br>' +
                                 'Date: %{x}<br>' +
@@ -93,16 +100,15 @@ class MarketVisualizer:
         Returns:
             plotly.graph_objects.Figure: Correlation heatmap
         """
+        import plotly.express as px
+        
         if self.analyzer is None:
-            returns = self.data.pct_change().dropna()
-            correlations = returns.corr()
+            correlations = self.returns.corr()
         else:
             correlations = self.analyzer.calculate_correlations()
         
         # Clean asset names
-        clean_names = [name.replace('_price', '').upper() for name in correlations.columns]
-        correlations.columns = clean_names
-        correlations.index = clean_names
+        correlations = correlations.rename(index=self._clean_names, columns=self._clean_names)
         
         fig = px.imshow(
             correlations,
@@ -129,8 +135,12 @@ class MarketVisualizer:
         Returns:
             plotly.graph_objects.Figure: Volatility plot
         """
-        returns = self.data.pct_change().dropna()
-        volatility = returns.rolling(window=window).std() * np.sqrt(365) * 100
+        import plotly.graph_objects as go
+        
+        if self.analyzer is not None:
+            volatility = self.analyzer.calculate_volatility(window) * 100
+        else:
+            volatility = self.returns.rolling(window=window).std() * np.sqrt(365) * 100
         
         fig = go.Figure()
         
@@ -138,7 +148,7 @@ class MarketVisualizer:
             fig.add_trace(go.Scatter(
                 x=volatility.index,
                 y=volatility[column],
-                name=column.replace('_price', '').upper(),
+                name=self._clean_names[column],
                 line=dict(width=2)
             ))
         
@@ -160,50 +170,39 @@ class MarketVisualizer:
         Returns:
             plotly.graph_objects.Figure: Performance metrics plot
         """
+        import plotly.express as px
+        
         if self.analyzer is None:
             print("❌ Need analyzer instance for performance metrics")
             return None
         
         performance = self.analyzer.calculate_performance_metrics()
         
-        # Clean asset names
-        performance.index = [name.replace('_price', '').upper() for name in performance.index]
-        
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('Total Return (%)', 'Annual Volatility (%)', 
-                          'Sharpe Ratio', 'Max Drawdown (%)'),
-            specs=[[{'type': 'bar'}, {'type': 'bar'}],
-                   [{'type': 'bar'}, {'type': 'bar'}]]
+        # One long frame drives all four panels
+        metric_colors = {
+            'Total Return (%)': 'lightblue',
+            'Annual Volatility (%)': 'lightcoral',
+            'Sharpe Ratio': 'lightgreen',
+            'Max Drawdown (%)': 'lightsalmon'
+        }
+        long_df = performance[list(metric_colors)].rename_axis('asset').reset_index().melt(
+            id_vars='asset', var_name='metric'
         )
         
-        # Total Return
-        fig.add_trace(
-            go.Bar(x=performance.index, y=performance['Total Return (%)'], 
-                  name='Total Return', marker_color='lightblue'),
-            row=1, col=1
-        )
-        
-        # Volatility
-        fig.add_trace(
-            go.Bar(x=performance.index, y=performance['Annual Volatility (%)'], 
-                  name='Volatility', marker_color='lightcoral'),
-            row=1, col=2
-        )
+        # Clean asset names
+        long_df['asset'] = long_df['asset'].map(self._clean_names)
         
-        # Sharpe Ratio
-        fig.add_trace(
-            go.Bar(x=performance.index, y=performance['Sharpe Ratio'], 
-                  name='Sharpe Ratio', marker_color='lightgreen'),
-            row=2, col=1
+        fig = px.bar(
+            long_df, x='asset', y='value',
+            facet_col='metric', facet_col_wrap=2, facet_row_spacing=0.12,
+            color='metric', color_discrete_map=metric_colors,
+            category_orders={'metric': list(metric_colors)}
         )
         
-        # Max Drawdown
-        fig.add_trace(
-            go.Bar(x=performance.index, y=performance['Max Drawdown (%)'], 
-                  name='Max Drawdown', marker_color='lightsalmon'),
-            row=2, col=2
-        )
+        # Each metric keeps its own scale and a plain subplot title
+        fig.update_yaxes(matches=None, showticklabels=True, title_text=None)
+        fig.update_xaxes(showticklabels=True, title_text=None)
+        fig.for_each_annotation(lambda annotation: annotation.update(text=annotation.text.split('=', 1)[-1]))
         
         fig.update_layout(
             title="Performance Metrics Comparison",
@@ -221,6 +220,8 @@ class MarketVisualizer:
         Returns:
             plotly.graph_objects.Figure: Comparison plot
         """
+        import plotly.graph_objects as go
+        
         if self.analyzer is None:
             print("❌ Need analyzer instance for crypto vs traditional analysis")
             return None
@@ -300,22 +301,30 @@ class MarketVisualizer:
         
         return plots
     
-    def save_plots(self, plots_dict=None):
+    def save_plots(self, plots_dict=None, test_mode=False):
         """
         Save all plots to files
         
         Args:
             plots_dict (dict): Dictionary of plots to save
+            test_mode (bool): Write bare <div> fragments without the page shell or
+                plotly.js bundle (enough to check the export path in tests)
         """
         if plots_dict is None:
             plots_dict = self.create_dashboard_plots()
         
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         
+        if test_mode:
+            html_options = {'include_plotlyjs': False, 'full_html': False}
+        else:
+            # plotly.min.js is written once next to the HTML files instead of embedded in each
+            html_options = {'include_plotlyjs': 'directory'}
+        
         for plot_name, fig in plots_dict.items():
             if fig is not None:
                 filename = f"results/{plot_name}_{timestamp}.html"
-                fig.write_html(filename)
+                fig.write_html(filename, **html_options)
                 print(f"✅ Saved {plot_name} to {filename}")
 
 # Example usage
@@ -1,119 +1,384 @@
 """
 Test Script for Crypto Market Analysis Project
 Run this to validate that everything is working correctly
+
+    python test_project.py             # step-by-step report
+    python test_project.py --fast      # stop after the analysis checks
+    python test_project.py --profile-imports 2> imports.log   # per-module import times
+    pytest test_project.py -n auto     # same checks as parallel pytest tests (pytest-xdist)
+
+On throwaway CI machines add -B (python -B test_project.py) to skip writing __pycache__.
 """
 
 import sys
 import os
-sys.path.append('src')
-
-def test_project():
-    """Test all components of the project"""
-    
-    print("🚀 Testing Crypto Market Analysis Project")
-    print("=" * 50)
-    
-    # Test 1: Import modules
-    print("\n1️⃣ Testing module imports...")
-    try:
-        from data_collector import CryptoMarketCollector
-        from analyzer import MarketAnalyzer
-        from visualizer import MarketVisualizer
-        print("✅ All modules imported successfully!")
-    except ImportError as e:
-        print(f"❌ Import error: {e}")
-        return False
-    
-    # Test 2: Data collection
-    print("\n2️⃣ Testing data collection...")
-    try:
-        collector = CryptoMarketCollector()
-        
-        # Test with small dataset
-        data = collector.get_combined_data(
-            crypto_ids=['bitcoin', 'ethereum'],
-            traditional_symbols=['SPY', 'QQQ'],
-            days=30  # Small dataset for testing
-        )
-        
-        if not data.empty:
-            print(f"✅ Data collected successfully! Shape: {data.shape}")
-            print(f"   Date range: {data.index.min()} to {data.index.max()}")
-        else:
-            print("❌ Data collection failed - empty dataset")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Data collection error: {e}")
-        return False
-    
-    # Test 3: Analysis
-    print("\n3️⃣ Testing analysis...")
-    try:
-        analyzer = MarketAnalyzer(data)
+
+# Before any heavy import: re-run under -X importtime so every import is reported on stderr
+if __name__ == "__main__" and "--profile-imports" in sys.argv:
+    os.execv(sys.executable, [sys.executable, "-X", "importtime", os.path.abspath(__file__)]
+             + [arg for arg in sys.argv[1:] if arg != "--profile-imports"])
+
+import asyncio
+import time
+import hashlib
+import functools
+import textwrap
+import traceback
+from itertools import islice
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+# Headless backend for whenever pyplot gets imported; matplotlib itself is only loaded
+# once a visualizer is built, so runs that stop earlier never pay for it
+os.environ["MPLBACKEND"] = "Agg"
+
+# Absolute and first on the path, so imports resolve the same from any working directory
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+RESULTS_DIR = Path("results")
+TEST_CACHE_DIR = "results/.test_cache"
+TEST_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+TEST_DATA_MAX_BYTES = 1_000_000  # regression guard for the smoke-test dataset
+
+TEST_CRYPTO_IDS = ['bitcoin', 'ethereum']
+TEST_TRADITIONAL_SYMBOLS = ['SPY', 'QQQ']
+TEST_DAYS = 14  # Small dataset for testing
+
+def load_test_data(collector, crypto_ids, traditional_symbols, days, refresh=False):
+    """
+    Collect the test dataset, reusing a copy cached on disk for up to a day
+    
+    Args:
+        collector (CryptoMarketCollector): Collector used on a cache miss
+        crypto_ids (list): Cryptocurrency IDs
+        traditional_symbols (list): Traditional market symbols
+        days (int): Days of historical data
+        refresh (bool): Ignore the cached copy and fetch again
         
-        # Test performance metrics
-        performance = analyzer.calculate_performance_metrics()
-        print(f"✅ Performance analysis complete! Assets analyzed: {len(performance)}")
+    Returns:
+        pd.DataFrame: Combined dataset
+    """
+    import pandas as pd
+    
+    key = hashlib.sha1(repr((tuple(crypto_ids), tuple(traditional_symbols), days)).encode()).hexdigest()
+    path = os.path.join(TEST_CACHE_DIR, f"{key}.parquet")
+    
+    if not refresh and os.path.exists(path) and time.time() - os.path.getmtime(path) < TEST_CACHE_MAX_AGE:
+        print(f"📦 Using cached test data ({path})")
+        return pd.read_parquet(path)
+    
+    data = asyncio.run(collector.get_combined_data_async(
+        crypto_ids=crypto_ids,
+        traditional_symbols=traditional_symbols,
+        days=days
+    ))
+    
+    if not data.empty:
+        os.makedirs(TEST_CACHE_DIR, exist_ok=True)
+        data.to_parquet(path)
+    
+    return data
+
+@functools.lru_cache(maxsize=1)
+def get_collector():
+    """Shared CryptoMarketCollector, so its requests.Session keeps connections alive"""
+    from data_collector import CryptoMarketCollector
+    return CryptoMarketCollector()
+
+_ANALYZERS = {}
+
+def get_analyzer(data):
+    """
+    MarketAnalyzer for a dataset, built once per DataFrame
+    
+    The analyzer keeps a reference to data (no copy) when it already has the
+    analyzer's dtype, which build_test_data guarantees with its float32 cast.
+    
+    Args:
+        data (pd.DataFrame): Dataset to analyze
         
-        # Test insights
-        insights = analyzer.generate_insights()
-        print(f"✅ Generated {len(insights)} market insights")
+    Returns:
+        MarketAnalyzer: Cached analyzer instance
+    """
+    from analyzer import MarketAnalyzer
+    
+    # Keyed by id(); the frame is kept alongside so its id cannot be reused
+    if id(data) not in _ANALYZERS:
+        _ANALYZERS[id(data)] = (data, MarketAnalyzer(data))
+    return _ANALYZERS[id(data)][1]
+
+def warm_up_kernels():
+    """
+    Compile the analyzer's Numba kernels on a tiny float32 frame
+    
+    The kernels are built with cache=True, so only the first run on a machine
+    pays the compile; afterwards this just loads them from __pycache__.
+    
+    Returns:
+        bool: True when compiled kernels are in use
+    """
+    import numpy as np
+    import pandas as pd
+    from analyzer import MarketAnalyzer
+    from _numba_kernels import NUMBA_AVAILABLE
+    
+    if NUMBA_AVAILABLE:
+        dummy = pd.DataFrame({'bitcoin_price': [1.0, 2.0, 3.0, 2.5, 3.5],
+                              'SPY_price': [4.0, 4.1, 4.2, 4.0, 4.3]}, dtype=np.float32)
+        warm_up = MarketAnalyzer(dummy)
+        warm_up.calculate_performance_metrics()
+        warm_up.calculate_volatility(window=2)
+    return NUMBA_AVAILABLE
+
+def build_visualizer(data, analyzer):
+    """
+    MarketVisualizer for the smoke test, importing matplotlib only at this point
+    
+    Args:
+        data (pd.DataFrame): Dataset to plot
+        analyzer (MarketAnalyzer): Analyzer over the same dataset
         
-    except Exception as e:
-        print(f"❌ Analysis error: {e}")
-        return False
-    
-    # Test 4: Visualizations
-    print("\n4️⃣ Testing visualizations...")
-    try:
-        visualizer = MarketVisualizer(data, analyzer)
+    Returns:
+        MarketVisualizer: Visualizer instance
+    """
+    import matplotlib
+    from visualizer import MarketVisualizer
+    
+    matplotlib.rcParams['path.simplify_threshold'] = 1.0
+    return MarketVisualizer(data, analyzer)
+
+def build_test_data(refresh=False):
+    """
+    Collect (or load from the cache) the smoke-test dataset
+    
+    Args:
+        refresh (bool): Ignore the cached copy and fetch again
         
-        # Test plot generation
-        price_plot = visualizer.plot_price_evolution()
-        correlation_plot = visualizer.plot_correlation_heatmap()
+    Returns:
+        pd.DataFrame: Combined dataset with float32 prices
+    """
+    data = load_test_data(get_collector(), TEST_CRYPTO_IDS, TEST_TRADITIONAL_SYMBOLS, TEST_DAYS, refresh=refresh)
+    
+    # Prices only need float32 precision for the checks below
+    return data.astype({column: 'float32' for column in data.select_dtypes('float64').columns})
+
+# =============================================================================
+# PYTEST FIXTURES (session scoped, so each worker collects the data once)
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def data():
+    """Smoke-test dataset (set REFRESH_TEST_DATA=1 to skip the cache)"""
+    return build_test_data(refresh=os.environ.get("REFRESH_TEST_DATA") == "1")
+
+@pytest.fixture(scope="session")
+def analyzer(data):
+    """MarketAnalyzer over the smoke-test dataset"""
+    return get_analyzer(data)
+
+@pytest.fixture(scope="session")
+def visualizer(data, analyzer):
+    """MarketVisualizer over the smoke-test dataset"""
+    return build_visualizer(data, analyzer)
+
+# =============================================================================
+# TESTS
+# =============================================================================
+
+def test_imports():
+    """Project modules import cleanly"""
+    from data_collector import CryptoMarketCollector  # noqa: F401
+    from analyzer import MarketAnalyzer  # noqa: F401
+    from visualizer import MarketVisualizer  # noqa: F401
+
+def test_collection(data):
+    """Data collection returns a small, non-empty dataset"""
+    assert not data.empty, "Data collection failed - empty dataset"
+    
+    memory_usage = data.memory_usage(deep=True).sum()
+    assert memory_usage <= TEST_DATA_MAX_BYTES, \
+        f"Test dataset uses {memory_usage:,} bytes (limit {TEST_DATA_MAX_BYTES:,})"
+
+def test_analysis(analyzer):
+    """Performance metrics and insights are produced for every asset"""
+    # The independent, memoized analyses run concurrently; generate_insights then only
+    # reads their cached results instead of racing them and computing them twice
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        performance_future = executor.submit(analyzer.calculate_performance_metrics)
+        correlations_future = executor.submit(analyzer.calculate_correlations)
+        comparison_future = executor.submit(analyzer.crypto_vs_traditional_analysis)
+        performance = performance_future.result()
+        correlations_future.result()
+        comparison_future.result()
+    insights = analyzer.generate_insights()
+    
+    assert len(performance) == analyzer.data.shape[1], "Missing assets in performance metrics"
+    assert insights, "No insights generated"
+
+def test_visualization(visualizer):
+    """Price and correlation plots can be built"""
+    # Visualizer and analyzer share the caller's frame and returns instead of copying them
+    assert visualizer.data is visualizer.analyzer.data, "Visualizer copied the analyzer's data"
+    assert visualizer.returns is visualizer.analyzer.returns, "Visualizer recomputed the returns"
+    
+    # Both plots are built concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        price_future = executor.submit(visualizer.plot_price_evolution)
+        correlation_future = executor.submit(visualizer.plot_correlation_heatmap)
+        price_plot = price_future.result()
+        correlation_plot = correlation_future.result()
+    
+    assert price_plot and correlation_plot, "Visualization generation failed"
+    # The heatmap reads the analyzer's memoized matrix rather than computing its own
+    assert 'correlations' in visualizer.analyzer.results, "Heatmap bypassed the analyzer's correlation cache"
+
+def test_save(analyzer, visualizer):
+    """Analysis and plots are exported to results/"""
+    # Create the output folder once up front rather than relying on each save call
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    
+    analysis_file = RESULTS_DIR / "test_analysis.txt"
+    analyzer.save_analysis(str(analysis_file))
+    assert analysis_file.exists(), "Analysis file was not written"
+    
+    plots = {
+        'test_price_evolution': visualizer.plot_price_evolution(),
+        'test_correlation': visualizer.plot_correlation_heatmap()
+    }
+    visualizer.save_plots(plots, test_mode=True)
+
+# =============================================================================
+# SCRIPT DRIVER
+# =============================================================================
+
+SUMMARY_TEMPLATE = textwrap.dedent("""
+    {separator}
+    🎉 ALL TESTS PASSED!
+    
+    📊 Project Summary:
+       • Data collected: {n_rows} days, {n_cols} assets
+       • Analysis complete: {n_assets} assets analyzed
+       • Insights generated: {n_insights} key findings
+    {outputs}""")
+
+def flush_log(log, *lines):
+    """Write the buffered report lines (plus any extra ones) in one call and clear the buffer"""
+    log.extend(lines)
+    if log:
+        sys.stdout.write("\n".join(log) + "\n")
+        sys.stdout.flush()
+        log.clear()
+
+def run_project_checks(refresh=False, fast=False):
+    """
+    Test all components of the project
+    
+    Args:
+        refresh (bool): Skip the cached test data and fetch again
+        fast (bool): Stop after the analysis phase (no plots, nothing written)
         
-        if price_plot and correlation_plot:
-            print("✅ Visualizations generated successfully!")
-        else:
-            print("❌ Visualization generation failed")
+    Returns:
+        bool: True when every phase passed
+    """
+    
+    # Report lines are buffered and written at the end (or as soon as a check fails)
+    log = []
+    state = {}
+    
+    def imports():
+        test_imports()
+        return ["✅ All modules imported successfully!"]
+    
+    def warm_up():
+        # Best effort: a failure here shows up again, with context, in the analysis phase
+        try:
+            compiled = warm_up_kernels()
+        except Exception as e:
+            return [f"⚠️ Kernel warm-up skipped: {e}"]
+        if compiled:
+            return ["✅ Numba kernels compiled (or loaded from cache)"]
+        return ["✅ Numba not installed, using the pandas implementation"]
+    
+    def collect():
+        state['data'] = build_test_data(refresh=refresh)
+        test_collection(state['data'])
+        data = state['data']
+        # The collector returns a date-sorted index, so the ends are the first and last labels
+        state['date_range'] = (data.index[0], data.index[-1])
+        state['shape'] = data.shape
+        return [f"✅ Data collected successfully! Shape: {state['shape']}",
+                "   Date range: {} to {}".format(*state['date_range'])]
+    
+    def analyze():
+        state['analyzer'] = get_analyzer(state['data'])
+        assert state['analyzer'].data is state['data'], "Analyzer copied the collected data"
+        test_analysis(state['analyzer'])
+        state['performance'] = state['analyzer'].calculate_performance_metrics()
+        state['insights'] = state['analyzer'].generate_insights()
+        return [f"✅ Performance analysis complete! Assets analyzed: {len(state['performance'])}",
+                f"✅ Generated {len(state['insights'])} market insights"]
+    
+    def visualize():
+        state['visualizer'] = build_visualizer(state['data'], state['analyzer'])
+        test_visualization(state['visualizer'])
+        return ["✅ Visualizations generated successfully!"]
+    
+    def save():
+        test_save(state['analyzer'], state['visualizer'])
+        return ["✅ Save functionality working!"]
+    
+    # (heading, label used in errors and timings, phase)
+    phases = [
+        ("1️⃣ Testing module imports...", "Import", imports),
+        ("⚙️ Warming up analyzer kernels...", "Kernel warm-up", warm_up),
+        ("2️⃣ Testing data collection...", "Data collection", collect),
+        ("3️⃣ Testing analysis...", "Analysis", analyze),
+        ("4️⃣ Testing visualizations...", "Visualization", visualize),
+        ("5️⃣ Testing save functionality...", "Save", save),
+    ]
+    if fast:
+        # Quick smoke for the edit loop: visualization and plot I/O are left to full runs
+        phases = phases[:4]
+    timings = []
+    
+    log.append("🚀 Testing Crypto Market Analysis Project")
+    log.append("=" * 50)
+    
+    for heading, label, phase in phases:
+        log.append(f"\n{heading}")
+        start = time.perf_counter_ns()
+        try:
+            lines = phase()
+        except Exception as e:
+            flush_log(log, f"❌ {label} error: {e}", traceback.format_exc())
             return False
-            
-    except Exception as e:
-        print(f"❌ Visualization error: {e}")
-        return False
-    
-    # Test 5: Save functionality
-    print("\n5️⃣ Testing save functionality...")
-    try:
-        # Save analysis
-        analyzer.save_analysis("results/test_analysis.txt")
-        
-        # Save plots
-        plots = {
-            'test_price_evolution': price_plot,
-            'test_correlation': correlation_plot
-        }
-        visualizer.save_plots(plots)
-        
-        print("✅ Save functionality working!")
-        
-    except Exception as e:
-        print(f"❌ Save error: {e}")
-        return False
+        elapsed_ms = (time.perf_counter_ns() - start) / 1e6
+        timings.append((label, elapsed_ms))
+        log.extend(lines)
+        log.append(f"⏱️ {label}: {elapsed_ms:.1f} ms")
+    
+    n_rows, n_cols = state['shape']
     
     # Final summary
-    print("\n" + "=" * 50)
-    print("🎉 ALL TESTS PASSED!")
-    print("\n📊 Project Summary:")
-    print(f"   • Data collected: {data.shape[0]} days, {data.shape[1]} assets")
-    print(f"   • Analysis complete: {len(performance)} assets analyzed")
-    print(f"   • Insights generated: {len(insights)} key findings")
-    print(f"   • Visualizations: Multiple charts created")
-    print(f"   • Files saved: Analysis and charts exported")
-    
-    print("\n🚀 Ready to run the dashboard!")
-    print("   Run: streamlit run dashboard/streamlit_app.py")
+    log.append(SUMMARY_TEMPLATE.format_map({
+        'separator': "=" * 50,
+        'n_rows': n_rows,
+        'n_cols': n_cols,
+        'n_assets': len(state['performance']),
+        'n_insights': len(state['insights']),
+        'outputs': ("   • Visualizations and save: skipped (--fast)" if fast else
+                    "   • Visualizations: Multiple charts created\n"
+                    "   • Files saved: Analysis and charts exported"),
+    }))
+    
+    log.append("\n⏱️ Phase timings (slowest first):")
+    for label, elapsed_ms in sorted(timings, key=lambda item: item[1], reverse=True):
+        log.append(f"   • {label}: {elapsed_ms:.1f} ms")
+    
+    log.append("\n🚀 Ready to run the dashboard!")
+    log.append("   Run: streamlit run dashboard/streamlit_app.py")
+    flush_log(log)
     
     return True
 
@@ -121,11 +386,19 @@ def show_sample_insights(insights):
     """Display sample insights from the analysis"""
     print("\n💡 Sample Insights:")
     print("-" * 20)
-    for i, insight in enumerate(insights[:3], 1):
+    for i, insight in enumerate(islice(insights, 3), 1):
         print(f"{i}. {insight}")
 
 if __name__ == "__main__":
-    success = test_project()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Validate the crypto market analysis project")
+    parser.add_argument("--refresh", action="store_true", help="Fetch fresh data instead of the cached test dataset")
+    parser.add_argument("--fast", action="store_true", help="Stop after the analysis checks (skip visualization and save)")
+    parser.add_argument("--profile-imports", action="store_true", help="Re-run under python -X importtime (report on stderr)")
+    args = parser.parse_args()
+    
+    success = run_project_checks(refresh=args.refresh, fast=args.fast)
     
     if success:
         print("\n✨ Your crypto market analysis project is ready!")